@@ -3,53 +3,160 @@ A2A agent card endpoint and server for privacy monitoring agents.
 Exposes /.well-known/agent.json and /a2a/message endpoints for agent-to-agent communication.
 """
 
+import asyncio
 import os
 import json
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import time
+from collections import OrderedDict
+from typing import List
+from fastapi import FastAPI
+from fastapi.responses import FileResponse
+from pydantic import BaseModel
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as JSONResponse
+except ImportError:
+    # orjson is optional; fall back to the stdlib-based response class
+    from fastapi.responses import JSONResponse
 from privacy_validator.adk_multi_agent_system import OrchestratorAgent
 
-app = FastAPI()
+app = FastAPI(default_response_class=JSONResponse)
+
+# Compress large orchestrator responses (reports/summaries can be hundreds of
+# KB). Prefer Brotli when brotli-asgi is installed, otherwise use gzip.
+try:
+    from brotli_asgi import BrotliMiddleware
+    app.add_middleware(BrotliMiddleware, minimum_size=1024)
+except ImportError:
+    from fastapi.middleware.gzip import GZipMiddleware
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Instantiate the orchestrator once per process (constructor discovers agent
+# cards over HTTP) so requests only pay for .run(), not agent discovery.
+orchestrator = OrchestratorAgent()
+
+# Read once at import; the environment does not change for a running process.
+_HOST_URL = os.getenv("HOST_OVERRIDE", "http://localhost:8080/")
 
 # --- Agent Card ---
-def get_agent_card():
-    return {
-        "capabilities": {"streaming": False},
-        "defaultInputModes": ["text", "text/plain"],
-        "defaultOutputModes": ["text", "text/plain"],
-        "description": "Privacy monitoring agent system (validator, scanner, summariser)",
-        "name": "privacy_monitor_agent",
-        "protocolVersion": "0.2.6",
-        "skills": [
-            {"id": "validate_privacy", "name": "Privacy Validation", "description": "Checks anonymisation/privacy compliance", "tags": ["validation"]},
-            {"id": "scan_privacy", "name": "Privacy Scanning", "description": "Scans for privacy risks", "tags": ["scanning"]},
-            {"id": "summarise_privacy", "name": "Privacy Summarisation", "description": "Generates explanation reports", "tags": ["summarisation"]}
-        ],
-        "url": os.getenv("HOST_OVERRIDE", "http://localhost:8080/"),
-        "version": "1.0.0"
-    }
+# The card is static for the lifetime of the process: freeze it at import and
+# let clients cache it instead of rebuilding the dict on every request.
+_AGENT_CARD = {
+    "capabilities": {"streaming": False},
+    "defaultInputModes": ["text", "text/plain"],
+    "defaultOutputModes": ["text", "text/plain"],
+    "description": "Privacy monitoring agent system (validator, scanner, summariser)",
+    "name": "privacy_monitor_agent",
+    "protocolVersion": "0.2.6",
+    "skills": [
+        {"id": "validate_privacy", "name": "Privacy Validation", "description": "Checks anonymisation/privacy compliance", "tags": ["validation"]},
+        {"id": "scan_privacy", "name": "Privacy Scanning", "description": "Scans for privacy risks", "tags": ["scanning"]},
+        {"id": "summarise_privacy", "name": "Privacy Summarisation", "description": "Generates explanation reports", "tags": ["summarisation"]}
+    ],
+    "url": _HOST_URL,
+    "version": "1.0.0"
+}
+_AGENT_CARD_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# Materialise the card to a static file at import so the route can serve it
+# from disk (sendfile + ETag/Last-Modified) instead of re-encoding JSON per
+# request. The file can also be fronted directly by a CDN or reverse proxy.
+_STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+_AGENT_CARD_PATH = os.path.join(_STATIC_DIR, "agent.json")
+os.makedirs(_STATIC_DIR, exist_ok=True)
+with open(_AGENT_CARD_PATH, "w") as _f:
+    json.dump(_AGENT_CARD, _f)
 
 @app.get("/.well-known/agent.json")
 def agent_card():
-    return JSONResponse(get_agent_card())
+    return FileResponse(_AGENT_CARD_PATH, media_type="application/json", headers=_AGENT_CARD_HEADERS)
+
+@app.on_event("startup")
+async def warmup():
+    """
+    Warm the process before the first /a2a/message arrives: spin up the
+    worker-thread pool and ping the downstream agent services so the first
+    real request does not pay cold-start costs.
+    """
+    def _ping_agents():
+        import requests
+        for url in orchestrator.agent_services.values():
+            try:
+                requests.get(f"{url}/.well-known/agent.json", timeout=2)
+            except Exception:
+                pass  # Agents may still be starting; discovery already ran at import
+    await asyncio.to_thread(_ping_agents)
 
 # --- A2A Message Endpoint ---
+class A2APart(BaseModel):
+    type: str = ""
+    text: str = ""
+
+class A2AMessage(BaseModel):
+    parts: List[A2APart] = []
+
+class A2AMessageRequest(BaseModel):
+    message: A2AMessage = A2AMessage()
+
+# Cache orchestrator results for repeated identical messages so re-submitted
+# requests skip the full validate/scan/summarise workflow. Entries expire
+# after A2A_RESULT_CACHE_TTL seconds (0 disables caching).
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_TTL = float(os.getenv("A2A_RESULT_CACHE_TTL", "300"))
+_RESULT_CACHE_MAX = int(os.getenv("A2A_RESULT_CACHE_MAX", "128"))
+
+# Bound how many orchestrator workflows run at once so a burst of requests
+# queues here instead of oversubscribing the thread pool and the downstream
+# agents, which protects tail latency.
+_ORCHESTRATOR_CONCURRENCY = asyncio.Semaphore(int(os.getenv("A2A_MAX_CONCURRENCY", "4")))
+
 @app.post("/a2a/message")
-async def a2a_message(request: Request):
-    data = await request.json()
-    message = data.get("message", {})
-    parts = message.get("parts", [])
-    text = ""
-    for part in parts:
-        if part.get("type") == "text":
-            text = part.get("text", "")
-            break
-    # Run orchestrator agent
-    orchestrator = OrchestratorAgent()
-    result = orchestrator.run(text)
+async def a2a_message(request: A2AMessageRequest):
+    # Take the first text part; the generator stops scanning as soon as one is found.
+    text = next((part.text for part in request.message.parts if part.type == "text"), "")
+    if _RESULT_CACHE_TTL > 0:
+        cached = _RESULT_CACHE.get(text)
+        if cached is not None and time.monotonic() - cached[0] < _RESULT_CACHE_TTL:
+            _RESULT_CACHE.move_to_end(text)
+            return JSONResponse({"result": cached[1]})
+    # Run the synchronous orchestrator in a worker thread so the slow
+    # validate/scan/summarise workflow does not block the event loop.
+    async with _ORCHESTRATOR_CONCURRENCY:
+        result = await asyncio.to_thread(orchestrator.run, text)
+    if _RESULT_CACHE_TTL > 0:
+        _RESULT_CACHE[text] = (time.monotonic(), result)
+        _RESULT_CACHE.move_to_end(text)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX:
+            _RESULT_CACHE.popitem(last=False)
     return JSONResponse({"result": result})
 
 # --- Entrypoint ---
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # Worker count is configurable via UVICORN_WORKERS (or the conventional
+    # WEB_CONCURRENCY). A common starting point is 2*cores+1 for I/O-bound
+    # workloads. The import-string form is required so uvicorn can re-import
+    # the app in each worker process when workers > 1.
+    # Container/systemd alternative:
+    #   gunicorn -k uvicorn.workers.UvicornWorker -w $UVICORN_WORKERS privacy_validator.a2a_server:app
+    workers = int(os.getenv("UVICORN_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+    # Prefer the faster uvloop event loop and httptools HTTP parser when they
+    # are installed; fall back to uvicorn's defaults otherwise.
+    try:
+        import uvloop  # noqa: F401
+        import httptools  # noqa: F401
+        loop_impl, http_impl = "uvloop", "httptools"
+    except ImportError:
+        loop_impl, http_impl = "auto", "auto"
+    uvicorn.run(
+        "privacy_validator.a2a_server:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8080")),
+        workers=workers,
+        loop=loop_impl,
+        http=http_impl,
+        # Keep connections from the orchestrator/UI open between polls and
+        # skip per-request access-log formatting unless explicitly enabled.
+        timeout_keep_alive=int(os.getenv("UVICORN_KEEPALIVE", "75")),
+        access_log=os.getenv("UVICORN_ACCESS_LOG", "0") == "1",
+    )
@@ -11,12 +11,186 @@ Agents:
 All summary generation is delegated to the LLM (Gemma) via gemma_client.summarise_privacy_report, ensuring output is clear, actionable, and suitable for non-technical audiences.
 """
 
+import csv
+import datetime
+import functools
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+
+import pandas as pd
+import requests
+try:
+    import orjson  # Optional: C JSON codec for the hot agent round-trips
+except ImportError:
+    orjson = None
 from google.adk.agents import LlmAgent
+
 from privacy_validator.gemma_client import ask_llm_for_column_roles
-import json
 from privacy_validator import gemma_client
+from privacy_validator.anonymisation_validator import AnonymisationValidator
 from privacy_validator.mcp_tool_tabular_scanner import discover_tabular_datasets
 
+# Static prompt sections for the summariser agents, assembled once at import
+# instead of being re-concatenated on every run. Keep these byte-identical
+# across calls: providers cache prompt prefixes implicitly, so all dynamic
+# content (dataset names, metrics) must come after the static prefix.
+_MULTI_SUMMARY_PROMPT_PREFIX = (
+    "System: Data Privacy Impact Assessment & Reporting\n"
+    "You are a third-party privacy auditor. Given the following datasets and their privacy scan results, generate a clear, actionable, and human-readable summary for a non-technical audience. For each dataset, include:\n"
+    "- The dataset name (no file paths)\n"
+    "- Any privacy risks or flags, with a brief explanation\n"
+    "- Recommended actions (if any)\n"
+    "- Model Context Protocol findings: k-anonymity, l-diversity, t-closeness, re-identification risk, and the threshold values used. IMPORTANT: Always report the actual metric values (even if low, zero, or below threshold). Do NOT say 'not calculated', 'not applicable', or 'not evaluated' unless the value is truly missing. If a metric is below threshold, state the value and that it did not meet the threshold.\n"
+    "- An explicit risk level for each dataset (e.g., Low, Moderate, High), based on the findings\n"
+    "For each dataset, include a section titled 'MCP Metric Findings' and present the following as a bullet list or table:\n"
+    "  - k-anonymity: minimum, average, required threshold, and status (Met/Not met/Not applicable)\n"
+    "  - l-diversity: minimum, average, method, required threshold, and status\n"
+    "  - t-closeness: maximum, average, method, required threshold, and status\n"
+    "  - re-identification risk: value, required threshold, and status\n"
+    "Always include the actual values and thresholds for each metric, even if the metric is not met.\n\n"
+    "Metric explanations (include these in the summary):\n"
+    "- k-anonymity: Measures how well data can be disguised within a group. Low k-anonymity means individuals may be more easily re-identified.\n"
+    "- l-diversity: Ensures that within each group, there is a sufficient number of distinct values for sensitive attributes. Low l-diversity means sensitive values are too similar within groups.\n"
+    "- t-closeness: Measures how close the distribution of a sensitive attribute in a group is to the distribution in the overall dataset. High t-closeness indicates a higher risk of attribute disclosure.\n"
+    "- Re-identification risk: Estimates the probability that an individual can be re-identified from the dataset, given the quasi-identifiers and sensitive attributes. A higher value means a greater risk of re-identification.\n"
+    "Definitions for metric status (include these in the summary):\n"
+    "- Not met: The metric was evaluated, but the dataset did not satisfy the required threshold (e.g., k-anonymity threshold was set, but the data did not reach it).\n"
+    "- Not applicable: The metric does not apply to the dataset, often because of its structure, content, or the privacy configuration (e.g., t-closeness is only relevant for certain types of sensitive data).\n"
+    "- Omitted: The metric was not calculated at all, either because the Model Context Protocol tool determined it was unnecessary, the dataset lacked the required attributes, or the scan configuration did not request it.\n\n"
+    "At the end, provide a short overall assessment and next steps for ongoing privacy protection. Also, provide an explicit overall risk level (e.g., Low, Moderate, High) for all datasets combined, based on your findings.\n\n"
+    "Datasets and results:\n"
+)
+
+_MULTI_SUMMARY_PROMPT_SUFFIX = (
+    "\nIMPORTANT: At the very top of your summary, clearly state the overall risk level for all datasets combined (e.g., Low, Moderate, High) before any other content.\n"
+    "Format the summary as a third-party privacy assessment for another party's system. "
+    "Be concise, use plain language, and make the findings easy to understand for non-technical stakeholders.\n"
+    "Do not include any date, 'To:', 'From:', or formal letter headers in the summary.\n"
+)
+
+# MCP findings section of the single-dataset summary prompt: a fixed template
+# filled in one format_map pass instead of a run of per-field f-strings.
+_MCP_FINDINGS_TEMPLATE = (
+    "Model Context Protocol Findings:\n"
+    "- k-anonymity: {k_min_disp}. The minimum group size was {k_min}, average was {k_avg}, required threshold: {k_req}.\n"
+    "- l-diversity: {l_min_disp}. The minimum diversity was {l_min}, average was {l_avg}, method: {l_method}, required threshold: {l_req}.\n"
+    "- t-closeness: {t_max_disp}. The maximum closeness was {t_max}, average was {t_avg}, method: {t_method}, required threshold: {t_req}.\n"
+    "- Re-identification risk: {reid_disp}. The dataset was evaluated against a risk threshold of {reid_req}.\n"
+)
+
+# Verbose debug logging (including pretty-printed MCP findings) is opt-in so
+# the hot path does not pay for json.dumps(indent=2) on every dataset.
+_DEBUG_LOG = os.getenv("PRIVACY_MONITOR_DEBUG", "0") == "1"
+
+# Precompiled fallback-extraction patterns for QI/sensitive columns, compiled
+# once at import rather than on every dataset in MultiDatasetSummariserAgent.run.
+_QI_SECTION_RE = re.compile(r'\*\*Quasi-Identifiers:\*\*.*?(?:contains|are) (?:the )?quasi-identifier[s]? "([^"]+)"')
+_QI_LIST_RE = re.compile(r'\*\*Quasi-Identifiers:\*\*\s*(.*?)\n')
+_SENS_SECTION_RE = re.compile(r'\*\*Sensitive Columns:\*\*.*?is "([^"]+)"')
+_SENS_LIST_RE = re.compile(r'\*\*Sensitive Columns:\*\*\s*(.*?)\n')
+_SENS_QUOTED_RE = re.compile(r'"([^"]+)"')
+_LIST_SPLIT_RE = re.compile(r',|and')
+
+# All recommended-action phrasings combined into one alternation so the
+# explanation text is scanned once instead of once per pattern. Group names
+# route each hit to the QI or sensitive bucket.
+_FALLBACK_COLUMN_RE = re.compile(
+    r'generaliz(?:e|ation|ing|ed|s|ation/suppression) of (?:the )?(?P<qi_gen>[\w_\-]+)'
+    r'|suppress(?:ion|ing)? (?:the )?(?P<qi_sup>[\w_\-]+)'
+    r'|quasi-identifier[s]? ["\']?(?P<qi_bullet>[\w_\- ]+)["\']?'
+    r'|bin(?:ning|ned|s|ning/handling)? (?:the )?(?P<sens_bin>[\w_\-]+)'
+    r'|handling (?:the )?(?P<sens_handle>[\w_\-]+)'
+    r'|sensitive (?:column|attribute|variable)[s]? ["\']?(?P<sens_bullet>[\w_\- ]+)["\']?',
+    re.IGNORECASE,
+)
+
+def _truncate(text, max_chars):
+    """
+    Truncate text to a max number of characters (approx. 4 chars per token),
+    appending a marker when cut. Single length check, single slice.
+    """
+    if len(text) > max_chars:
+        return text[:max_chars] + "... [truncated]"
+    return text
+
+def _truncate_value(value, max_chars):
+    """
+    Stringify-and-truncate for prompt fields. For long lists the elements
+    that could possibly fit are stringified instead of materialising the
+    full repr only to slice it away (flags/recommendations can be huge).
+    """
+    if isinstance(value, list) and len(value) > max_chars // 2:
+        return _truncate(str(value[:max_chars // 2]), max_chars)
+    return _truncate(value if isinstance(value, str) else str(value), max_chars)
+
+# Markers treated as "missing" in threshold params, hashed once as a frozenset
+# instead of rebuilding a tuple for every membership check.
+_MISSING = frozenset({None, '', 'N/A'})
+
+@functools.lru_cache(maxsize=512)
+def _robust_metric_cached(val):
+    if val is None:
+        return 'not calculated'
+    if isinstance(val, str) and val.strip() == '':
+        return 'not calculated'
+    if isinstance(val, float) and (val != val):
+        return 'not calculated'
+    return val
+
+def _robust_metric(val):
+    """
+    Return 'not calculated' for None, empty string, empty list/dict, or NaN,
+    else the value. Shared by the summariser agents instead of being redefined
+    as a closure on every run. The value space is tiny (thresholds, method
+    names, lots of None/'N/A'), so hashable inputs go through an LRU cache.
+    """
+    try:
+        return _robust_metric_cached(val)
+    except TypeError:
+        # Unhashable (list/dict): only the empty-container check applies
+        return 'not calculated' if len(val) == 0 else val
+
+def _infer_threshold(val, fallback):
+    """Return val unless it is a missing marker (None, '', 'N/A'), else fallback."""
+    return val if val not in _MISSING else fallback
+
+def _load_csv(path_or_text, is_path=True):
+    """
+    Parse CSV input (file path or raw CSV text) into a DataFrame.
+    Uses pyarrow's multi-threaded streaming reader when available, which
+    avoids pandas' single-threaded row materialisation on large files;
+    falls back to pandas otherwise.
+    """
+    try:
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(path_or_text if is_path else StringIO(path_or_text))
+    source = path_or_text if is_path else BytesIO(path_or_text.encode("utf-8"))
+    return pa_csv.read_csv(source).to_pandas()
+
+def _scan_fallback_columns(explanation_text):
+    """
+    Single pass over explanation text collecting QI and sensitive column
+    mentions from recommended-action phrasing.
+    Returns (qi_hits, sensitive_hits).
+    """
+    qi_hits = []
+    sens_hits = []
+    for m in _FALLBACK_COLUMN_RE.finditer(explanation_text):
+        hit = m.group('qi_gen') or m.group('qi_sup') or m.group('qi_bullet')
+        if hit:
+            if hit.strip():
+                qi_hits.append(hit.strip())
+            continue
+        hit = m.group('sens_bin') or m.group('sens_handle') or m.group('sens_bullet')
+        if hit and hit.strip():
+            sens_hits.append(hit.strip())
+    return qi_hits, sens_hits
+
 # Multi-dataset summariser agent for orchestrator aggregation
 class MultiDatasetSummariserAgent(LlmAgent):
     def __init__(self):
@@ -32,58 +206,36 @@ class MultiDatasetSummariserAgent(LlmAgent):
         - Delegates summary construction to the LLM via gemma_client.summarise_privacy_report.
         - Truncates input to fit within LLM token limits.
         """
-    
-        # Helper to truncate text to a max number of characters (approx. 4 chars per token)
-        def truncate(text, max_chars):
-            if len(text) > max_chars:
-                return text[:max_chars] + "... [truncated]"
-            return text
-
-
-
         # Conservative estimate: 8192 tokens * 4 chars/token = 32,768 chars
         # Reserve 2,000 chars for instructions and formatting
         MAX_PROMPT_CHARS = 30000
         MAX_PER_DATASET = 2000  # chars per dataset block (validator + explanation)
 
-        prompt = (
-            "System: Data Privacy Impact Assessment & Reporting\n"
-            "You are a third-party privacy auditor. Given the following datasets and their privacy scan results, generate a clear, actionable, and human-readable summary for a non-technical audience. For each dataset, include:\n"
-            "- The dataset name (no file paths)\n"
-            "- Any privacy risks or flags, with a brief explanation\n"
-            "- Recommended actions (if any)\n"
-            "- Model Context Protocol findings: k-anonymity, l-diversity, t-closeness, re-identification risk, and the threshold values used. IMPORTANT: Always report the actual metric values (even if low, zero, or below threshold). Do NOT say 'not calculated', 'not applicable', or 'not evaluated' unless the value is truly missing. If a metric is below threshold, state the value and that it did not meet the threshold.\n"
-            "- An explicit risk level for each dataset (e.g., Low, Moderate, High), based on the findings\n"
-            "For each dataset, include a section titled 'MCP Metric Findings' and present the following as a bullet list or table:\n"
-            "  - k-anonymity: minimum, average, required threshold, and status (Met/Not met/Not applicable)\n"
-            "  - l-diversity: minimum, average, method, required threshold, and status\n"
-            "  - t-closeness: maximum, average, method, required threshold, and status\n"
-            "  - re-identification risk: value, required threshold, and status\n"
-            "Always include the actual values and thresholds for each metric, even if the metric is not met.\n\n"
-            "Metric explanations (include these in the summary):\n"
-            "- k-anonymity: Measures how well data can be disguised within a group. Low k-anonymity means individuals may be more easily re-identified.\n"
-            "- l-diversity: Ensures that within each group, there is a sufficient number of distinct values for sensitive attributes. Low l-diversity means sensitive values are too similar within groups.\n"
-            "- t-closeness: Measures how close the distribution of a sensitive attribute in a group is to the distribution in the overall dataset. High t-closeness indicates a higher risk of attribute disclosure.\n"
-            "- Re-identification risk: Estimates the probability that an individual can be re-identified from the dataset, given the quasi-identifiers and sensitive attributes. A higher value means a greater risk of re-identification.\n"
-            "Definitions for metric status (include these in the summary):\n"
-            "- Not met: The metric was evaluated, but the dataset did not satisfy the required threshold (e.g., k-anonymity threshold was set, but the data did not reach it).\n"
-            "- Not applicable: The metric does not apply to the dataset, often because of its structure, content, or the privacy configuration (e.g., t-closeness is only relevant for certain types of sensitive data).\n"
-            "- Omitted: The metric was not calculated at all, either because the Model Context Protocol tool determined it was unnecessary, the dataset lacked the required attributes, or the scan configuration did not request it.\n\n"
-            "At the end, provide a short overall assessment and next steps for ongoing privacy protection. Also, provide an explicit overall risk level (e.g., Low, Moderate, High) for all datasets combined, based on your findings.\n\n"
-            "Datasets and results:\n"
-        )
+        # Accumulate prompt pieces and join once at the end; += in the loop
+        # would re-copy the growing prompt for every dataset.
+        prompt_parts = [_MULTI_SUMMARY_PROMPT_PREFIX]
+
+        # Buffer debug lines for the whole run and flush them in one append at
+        # the end instead of re-opening the log file per dataset. One timestamp
+        # per run is enough granularity for these lines and avoids a
+        # datetime.now() call per dataset.
+        debug_log_lines = []
+        log_path = log_file_path or 'log.txt'
+        run_ts = datetime.datetime.now()
 
-        used_chars = len(prompt)
+        used_chars = len(_MULTI_SUMMARY_PROMPT_PREFIX)
         n_datasets = len(explanations)
         # Dynamically allocate per-dataset block size
         available_chars = MAX_PROMPT_CHARS - used_chars - 2000  # Reserve for summary instructions
         per_dataset_chars = max(1200, min(3000, available_chars // max(1, n_datasets)))
         for i, explanation in enumerate(explanations):
             if used_chars > MAX_PROMPT_CHARS:
-                prompt += f"\n[Truncated: Too many datasets to fit in LLM input. Only the first {i} datasets are included.]\n"
+                prompt_parts.append(f"\n[Truncated: Too many datasets to fit in LLM input. Only the first {i} datasets are included.]\n")
                 break
             name = dataset_names[i] if dataset_names and i < len(dataset_names) else f"Dataset {i+1}"
-            block = f"\n---\nDataset: {name}\n"
+            # Per-dataset block accumulated as a list and joined once;
+            # repeated += re-copies the growing string on every append.
+            block_parts = [f"\n---\nDataset: {name}\n"]
             # Always try to get scan from explanation if possible
             scan = None
             if isinstance(explanation, dict):
@@ -108,44 +260,36 @@ class MultiDatasetSummariserAgent(LlmAgent):
                             mcp = json.loads(mcp)
                         except Exception:
                             mcp = None
-                    # DEBUG: Print raw and parsed MCP findings to log.txt
-                    import datetime
-                    log_path = log_file_path or 'log.txt'
-                    try:
-                        with open(log_path, 'a') as logf:
-                            logf.write(f"[MultiDatasetSummariserAgent][DEBUG {datetime.datetime.now()}] RAW MCP findings for dataset {i}: {raw_mcp}\n")
-                            logf.write(f"[MultiDatasetSummariserAgent][DEBUG {datetime.datetime.now()}] PARSED MCP findings for dataset {i}: {json.dumps(mcp, indent=2) if mcp else mcp}\n")
-                    except Exception:
-                        pass
-                    # Robust metric extraction: always show real values if present, only 'not calculated' if truly missing
-                    def robust_metric(val):
-                        if val is None:
-                            return 'not calculated'
-                        if isinstance(val, str) and val.strip() == '':
-                            return 'not calculated'
-                        if isinstance(val, (list, dict)) and len(val) == 0:
-                            return 'not calculated'
-                        if isinstance(val, float) and (val != val):
-                            return 'not calculated'
-                        return val
-                    def infer_threshold(val, fallback):
-                        return val if val not in (None, '', 'N/A') else fallback
-                    k = mcp.get('k_anonymity', {}) if mcp else {}
-                    l = mcp.get('l_diversity', {}) if mcp else {}
-                    t = mcp.get('t_closeness', {}) if mcp else {}
-                    params = mcp.get('params', {}) if mcp else {}
+                    # DEBUG: Buffer raw and parsed MCP findings for log.txt
+                    # (pretty-printing is only worth paying for when enabled)
+                    if _DEBUG_LOG:
+                        debug_log_lines.append(f"[MultiDatasetSummariserAgent][DEBUG {run_ts}] RAW MCP findings for dataset {i}: {raw_mcp}\n")
+                        debug_log_lines.append(f"[MultiDatasetSummariserAgent][DEBUG {run_ts}] PARSED MCP findings for dataset {i}: {json.dumps(mcp, indent=2) if mcp else mcp}\n")
+                    # Destructure the MCP findings once instead of re-testing
+                    # mcp for each section lookup
+                    if mcp:
+                        k = mcp.get('k_anonymity', {})
+                        l = mcp.get('l_diversity', {})
+                        t = mcp.get('t_closeness', {})
+                        params = mcp.get('params', {})
+                    else:
+                        k = l = t = params = {}
                     qi_count = len(scan.get('quasi_identifiers', [])) if scan else 'N/A'
                     sensitive_count = len(scan.get('sensitive', [])) if scan else 'N/A'
-                    k_req = robust_metric(params.get('k_required')) if params.get('k_required') not in (None, '', 'N/A') else qi_count if qi_count != 0 else 'N/A'
-                    l_req = robust_metric(params.get('l_required')) if params.get('l_required') not in (None, '', 'N/A') else sensitive_count if sensitive_count != 0 else 'N/A'
-                    t_req = robust_metric(params.get('t_required')) if params.get('t_required') not in (None, '', 'N/A') else 0.2
-                    reid_req = robust_metric(params.get('reid_required')) if params.get('reid_required') not in (None, '', 'N/A') else 0.05
+                    # Fetch each threshold once; the guard and the formatted
+                    # value share the same lookup
+                    kr, lr, tr, rr = (params.get('k_required'), params.get('l_required'),
+                                      params.get('t_required'), params.get('reid_required'))
+                    k_req = _robust_metric(kr) if kr not in _MISSING else qi_count if qi_count != 0 else 'N/A'
+                    l_req = _robust_metric(lr) if lr not in _MISSING else sensitive_count if sensitive_count != 0 else 'N/A'
+                    t_req = _robust_metric(tr) if tr not in _MISSING else 0.2
+                    reid_req = _robust_metric(rr) if rr not in _MISSING else 0.05
                     # Always include MCP findings in detail, matching individual summary style
-                    block += "MCP Findings (detailed):\n"
-                    block += f"  k-anonymity: min={robust_metric(k.get('k_min'))}, avg={robust_metric(k.get('k_avg'))}, required={k_req}\n"
-                    block += f"  l-diversity: min={robust_metric(l.get('l_min'))}, avg={robust_metric(l.get('l_avg'))}, method={robust_metric(l.get('method'))}, required={l_req}\n"
-                    block += f"  t-closeness: max={robust_metric(t.get('t_max'))}, avg={robust_metric(t.get('t_avg'))}, method={robust_metric(t.get('method'))}, required={t_req}\n"
-                    block += f"  re-identification risk: {reid_req}\n"
+                    block_parts.append("MCP Findings (detailed):\n")
+                    block_parts.append(f"  k-anonymity: min={_robust_metric(k.get('k_min'))}, avg={_robust_metric(k.get('k_avg'))}, required={k_req}\n")
+                    block_parts.append(f"  l-diversity: min={_robust_metric(l.get('l_min'))}, avg={_robust_metric(l.get('l_avg'))}, method={_robust_metric(l.get('method'))}, required={l_req}\n")
+                    block_parts.append(f"  t-closeness: max={_robust_metric(t.get('t_max'))}, avg={_robust_metric(t.get('t_avg'))}, method={_robust_metric(t.get('method'))}, required={t_req}\n")
+                    block_parts.append(f"  re-identification risk: {reid_req}\n")
             # Extract QI and Sensitive columns from MCP findings if available, else parse from summary text
             qis = []
             sensitive = []
@@ -159,75 +303,62 @@ class MultiDatasetSummariserAgent(LlmAgent):
                 sensitive = scan.get('sensitive', [])
             # If still empty, try to extract from explanation text using regex and recommended actions
             if not qis or not sensitive:
-                import re
                 explanation_text = explanation.get('explanation') if isinstance(explanation, dict) else None
                 if explanation_text:
-                    # Extract QI columns from dedicated section or recommended actions
-                    qi_match = re.search(r'\*\*Quasi-Identifiers:\*\*.*?(?:contains|are) (?:the )?quasi-identifier[s]? "([^"]+)"', explanation_text)
-                    if qi_match:
-                        qis = [qi_match.group(1)]
-                    else:
-                        # Try to extract list format
-                        qi_list_match = re.search(r'\*\*Quasi-Identifiers:\*\*\s*(.*?)\n', explanation_text)
-                        if qi_list_match:
-                            qis = [qi.strip() for qi in re.split(r',|and', qi_list_match.group(1)) if qi.strip()]
-                    # Fallback: look for recommended actions mentioning QIs
+                    # Only run the regexes for the side that is still missing;
+                    # typically MCP/scan populated one (or both) already.
                     if not qis:
-                        qiactions = re.findall(r'generaliz(?:e|ation|ing|ed|s|ation/suppression) of (?:the )?([\w_\-]+)', explanation_text, re.IGNORECASE)
-                        qis += [q.strip() for q in qiactions if q.strip()]
-                        qiactions2 = re.findall(r'suppress(?:ion|ing)? (?:the )?([\w_\-]+)', explanation_text, re.IGNORECASE)
-                        qis += [q.strip() for q in qiactions2 if q.strip()]
-                        # Also look for bullet points mentioning QIs
-                        qibullets = re.findall(r'quasi-identifier[s]? ["\']?([\w_\- ]+)["\']?', explanation_text, re.IGNORECASE)
-                        qis += [q.strip() for q in qibullets if q.strip()]
-                    # Extract Sensitive columns from dedicated section or recommended actions
-                    sens_match = re.search(r'\*\*Sensitive Columns:\*\*.*?is "([^"]+)"', explanation_text)
-                    if sens_match:
-                        sensitive = [sens_match.group(1)]
-                    else:
-                        # Try to extract additional sensitive columns
-                        sens_list_match = re.search(r'\*\*Sensitive Columns:\*\*\s*(.*?)\n', explanation_text)
-                        if sens_list_match:
-                            # Look for quoted columns
-                            sensitive = re.findall(r'"([^"]+)"', sens_list_match.group(1))
-                            # If not quoted, split by comma or 'and'
-                            if not sensitive:
-                                sensitive = [s.strip() for s in re.split(r',|and', sens_list_match.group(1)) if s.strip()]
-                    # Fallback: look for recommended actions mentioning sensitive columns
+                        # Extract QI columns from dedicated section or recommended actions
+                        qi_match = _QI_SECTION_RE.search(explanation_text)
+                        if qi_match:
+                            qis = [qi_match.group(1)]
+                        else:
+                            # Try to extract list format
+                            qi_list_match = _QI_LIST_RE.search(explanation_text)
+                            if qi_list_match:
+                                qis = [qi.strip() for qi in _LIST_SPLIT_RE.split(qi_list_match.group(1)) if qi.strip()]
                     if not sensitive:
-                        sensactions = re.findall(r'bin(?:ning|ned|s|ning/handling)? (?:the )?([\w_\-]+)', explanation_text, re.IGNORECASE)
-                        sensitive += [s.strip() for s in sensactions if s.strip()]
-                        sensactions2 = re.findall(r'handling (?:the )?([\w_\-]+)', explanation_text, re.IGNORECASE)
-                        sensitive += [s.strip() for s in sensactions2 if s.strip()]
-                        # Also look for bullet points mentioning sensitive columns
-                        sensbullets = re.findall(r'sensitive (?:column|attribute|variable)[s]? ["\']?([\w_\- ]+)["\']?', explanation_text, re.IGNORECASE)
-                        sensitive += [s.strip() for s in sensbullets if s.strip()]
+                        # Extract Sensitive columns from dedicated section or recommended actions
+                        sens_match = _SENS_SECTION_RE.search(explanation_text)
+                        if sens_match:
+                            sensitive = [sens_match.group(1)]
+                        else:
+                            # Try to extract additional sensitive columns
+                            sens_list_match = _SENS_LIST_RE.search(explanation_text)
+                            if sens_list_match:
+                                # Look for quoted columns
+                                sensitive = _SENS_QUOTED_RE.findall(sens_list_match.group(1))
+                                # If not quoted, split by comma or 'and'
+                                if not sensitive:
+                                    sensitive = [s.strip() for s in _LIST_SPLIT_RE.split(sens_list_match.group(1)) if s.strip()]
+                    # Fallback: one combined scan for recommended actions or
+                    # bullet points mentioning QI/sensitive columns
+                    if not qis or not sensitive:
+                        qi_hits, sens_hits = _scan_fallback_columns(explanation_text)
+                        if not qis:
+                            qis += qi_hits
+                        if not sensitive:
+                            sensitive += sens_hits
             # Extra debug log for extracted QI and sensitive columns
-            log_path = log_file_path or 'log.txt'
-            try:
-                with open(log_path, 'a') as logf:
-                    logf.write(f"[MultiDatasetSummariserAgent][DEBUG] Dataset {name} EXTRACTED QI columns: {qis}\n")
-                    logf.write(f"[MultiDatasetSummariserAgent][DEBUG] Dataset {name} EXTRACTED Sensitive columns: {sensitive}\n")
-            except Exception:
-                pass
-            block += f"Quasi-Identifiers (QI columns): {qis if qis else 'None detected'}\n"
-            block += f"Sensitive columns: {sensitive if sensitive else 'None detected'}\n"
-            block += ("Instructions: You MUST explicitly list the Quasi-Identifiers (QI columns) and Sensitive columns for this dataset exactly as provided above. "
-                      "If the list is empty, write 'None detected'. Do NOT omit these fields or reword them. If any are present, list them by name as shown.\n")
-            prompt += block
+            debug_log_lines.append(f"[MultiDatasetSummariserAgent][DEBUG] Dataset {name} EXTRACTED QI columns: {qis}\n")
+            debug_log_lines.append(f"[MultiDatasetSummariserAgent][DEBUG] Dataset {name} EXTRACTED Sensitive columns: {sensitive}\n")
+            block_parts.append(f"Quasi-Identifiers (QI columns): {qis if qis else 'None detected'}\n")
+            block_parts.append(f"Sensitive columns: {sensitive if sensitive else 'None detected'}\n")
+            block_parts.append("Instructions: You MUST explicitly list the Quasi-Identifiers (QI columns) and Sensitive columns for this dataset exactly as provided above. "
+                               "If the list is empty, write 'None detected'. Do NOT omit these fields or reword them. If any are present, list them by name as shown.\n")
+            block = ''.join(block_parts)
+            prompt_parts.append(block)
             used_chars += len(block)
 
-        prompt += ("\nIMPORTANT: At the very top of your summary, clearly state the overall risk level for all datasets combined (e.g., Low, Moderate, High) before any other content.\n"
-            "Format the summary as a third-party privacy assessment for another party's system. "
-            "Be concise, use plain language, and make the findings easy to understand for non-technical stakeholders.\n"
-            "Do not include any date, 'To:', 'From:', or formal letter headers in the summary.\n")
+        prompt_parts.append(_MULTI_SUMMARY_PROMPT_SUFFIX)
+        prompt = "".join(prompt_parts)
 
-        # DEBUG: Print the full prompt sent to the LLM
+        # DEBUG: Flush buffered debug lines plus the full prompt in one append
         debug_prompt_msg = f"[MultiDatasetSummariserAgent] FULL PROMPT TO LLM:\n{prompt}\n"
-        log_path = log_file_path or 'log.txt'
+        debug_log_lines.append(debug_prompt_msg)
         try:
             with open(log_path, 'a') as logf:
-                logf.write(debug_prompt_msg)
+                logf.write("".join(debug_log_lines))
         except Exception:
             pass
         if log_event:
@@ -249,27 +380,34 @@ class ValidatorAgent(LlmAgent):
         )
     def run(self, dataset, log_event=None, dataset_path=None, qi_cols=None, sensitive_col=None, external_path=None,
             k_required=None, l_required=None, l_method="distinct", t_required=None, reid_required=None,
-            numeric_bins=15, dominance_threshold=0.9, rare_threshold=1, binning_method="fd", t_method="tvd", **kwargs):
+            numeric_bins=15, dominance_threshold=0.9, rare_threshold=1, binning_method="fd", t_method="tvd",
+            dataset_format=None, **kwargs):
         """
         Run full MCP anonymisation validation with all configurable parameters.
+        dataset_format: 'path' (CSV file path), 'csv' (raw CSV text), or
+        'records' (tabular data for DataFrame). When None, the legacy
+        content sniffing is used.
         Returns a detailed report including MCP findings and recommended actions.
         """
-        import pandas as pd
-        import json
-        from privacy_validator.anonymisation_validator import AnonymisationValidator
         # Load dataset
-        if isinstance(dataset, str) and (dataset.endswith('.csv') or '\n' in dataset):
-            if '\n' in dataset and not dataset.endswith('.csv'):
-                # Assume CSV string
-                from io import StringIO
-                df = pd.read_csv(StringIO(dataset))
+        if dataset_format is None:
+            # Legacy sniffing: scanning the whole payload for a newline is
+            # O(len(dataset)); callers should pass dataset_format explicitly.
+            if isinstance(dataset, str) and dataset.endswith('.csv'):
+                dataset_format = 'path'
+            elif isinstance(dataset, str) and '\n' in dataset:
+                dataset_format = 'csv'
             else:
-                df = pd.read_csv(dataset)
+                dataset_format = 'records'
+        if dataset_format == 'path':
+            df = _load_csv(dataset)
+        elif dataset_format == 'csv':
+            df = _load_csv(dataset, is_path=False)
         else:
             df = pd.DataFrame(dataset)
         aux_df = None
         if external_path:
-            aux_df = pd.read_csv(external_path)
+            aux_df = _load_csv(external_path)
         validator = AnonymisationValidator(df)
         # Use default params if not provided
         if not qi_cols:
@@ -300,7 +438,6 @@ class ValidatorAgent(LlmAgent):
             t_method=t_method
         )
         # DEBUG: Print MCP findings and all computed metric values before returning
-        import datetime
         debug_msg = f"[DEBUG {datetime.datetime.now()}] ValidatorAgent MCP findings: {json.dumps(report, indent=2)}\n"
         if log_event:
             log_event(debug_msg)
@@ -320,74 +457,50 @@ class ScannerAgent(LlmAgent):
             model="gemma-3n-e4b-it",
             description="Scans for privacy risks and classifies columns using LLM."
         )
-    def run(self, log_event=None, search_glob="**/*.csv", log_file_path=None, **kwargs):
+    def run(self, log_event=None, search_glob="**/*.csv", log_file_path=None, max_workers=4, **kwargs):
         """
         MCP tool: Discover all tabular datasets (CSV) in the repository and use the LLM to classify QI and sensitive columns.
+        Per-file classification is I/O-bound (one LLM call per file), so files are scanned concurrently in a small thread pool.
         """
-        import pandas as pd
-        dataset_paths = discover_tabular_datasets()
-        results = []
-        for path in dataset_paths:
+        def scan_path(path):
             qis = []
             sensitive = []
+            log_lines = []
             try:
-                df = pd.read_csv(path, nrows=1)
-                columns = list(df.columns)
+                # Only the header row is needed; read it directly instead of
+                # spinning up a pandas parse of the file.
+                with open(path, newline='') as f:
+                    columns = next(csv.reader(f), [])
                 # Use shared function for LLM-based classification
-                log_line = f"[ScannerAgent] Columns for {path}: {columns}"
-                if callable(log_event):
-                    log_event(log_line)
-                if log_file_path:
-                    try:
-                        with open(log_file_path, 'a') as f:
-                            f.write(log_line + "\n")
-                    except Exception:
-                        pass
+                log_lines.append(f"[ScannerAgent] Columns for {path}: {columns}")
                 try:
                     roles = ask_llm_for_column_roles(columns, log_file_path=log_file_path)
-                    log_line2 = f"[ScannerAgent] ask_llm_for_column_roles result for {path}: {roles}"
-                    if callable(log_event):
-                        log_event(log_line2)
-                    if log_file_path:
-                        try:
-                            with open(log_file_path, 'a') as f:
-                                f.write(log_line2 + "\n")
-                        except Exception:
-                            pass
+                    log_lines.append(f"[ScannerAgent] ask_llm_for_column_roles result for {path}: {roles}")
                     qis = roles.get("quasi_identifiers", [])
                     sensitive = roles.get("sensitive", [])
                 except Exception as e:
-                    log_line3 = f"[ScannerAgent] ask_llm_for_column_roles error for {path}: {e}"
-                    if callable(log_event):
-                        log_event(log_line3)
-                    if log_file_path:
-                        try:
-                            with open(log_file_path, 'a') as f:
-                                f.write(log_line3 + "\n")
-                        except Exception:
-                            pass
+                    log_lines.append(f"[ScannerAgent] ask_llm_for_column_roles error for {path}: {e}")
             except Exception as e:
-                log_line4 = f"[ScannerAgent] Failed to read {path}: {e}"
-                if callable(log_event):
-                    log_event(log_line4)
-                if log_file_path:
-                    try:
-                        with open(log_file_path, 'a') as f:
-                            f.write(log_line4 + "\n")
-                    except Exception:
-                        pass
-            results.append({
-                "path": path,
-                "quasi_identifiers": qis,
-                "sensitive": sensitive
-            })
-        log_line5 = f"[ScannerAgent] Discovered datasets with QI/sensitive: {results}"
+                log_lines.append(f"[ScannerAgent] Failed to read {path}: {e}")
+            return {"path": path, "quasi_identifiers": qis, "sensitive": sensitive}, log_lines
+
+        dataset_paths = discover_tabular_datasets()
+        results = []
+        all_log_lines = []
+        if dataset_paths:
+            # pool.map preserves discovery order, so results stay deterministic
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(dataset_paths))) as pool:
+                for entry, log_lines in pool.map(scan_path, dataset_paths):
+                    results.append(entry)
+                    all_log_lines.extend(log_lines)
+        all_log_lines.append(f"[ScannerAgent] Discovered datasets with QI/sensitive: {results}")
         if callable(log_event):
-            log_event(log_line5)
+            for line in all_log_lines:
+                log_event(line)
         if log_file_path:
             try:
                 with open(log_file_path, 'a') as f:
-                    f.write(log_line5 + "\n")
+                    f.write("\n".join(all_log_lines) + "\n")
             except Exception:
                 pass
         return {"discovered_datasets": results}
@@ -406,13 +519,6 @@ class SummariserAgent(LlmAgent):
         - Delegates summary construction to the LLM via gemma_client.summarise_privacy_report.
         - Truncates input to fit within LLM token limits.
         """
-       
-        # Helper to truncate text to a max number of characters (approx. 4 chars per token)
-        def truncate(text, max_chars):
-            if len(text) > max_chars:
-                return text[:max_chars] + "... [truncated]"
-            return text
-
         # Conservative estimate: 8192 tokens * 4 chars/token = 32,768 chars
         # Reserve 2,000 chars for instructions and formatting
         MAX_PROMPT_CHARS = 30000
@@ -420,10 +526,12 @@ class SummariserAgent(LlmAgent):
 
         dataset_str = ", ".join(dataset_names) if dataset_names else "This dataset"
 
+        # Static instructions first (cache-friendly prefix); the dataset name
+        # is appended with the rest of the dynamic content below.
         prompt = (
             "System: Data Privacy Impact Assessment & Reporting\n"
-            f"You are a third-party privacy auditor. Given the following dataset and its privacy scan results, generate a clear, actionable, and human-readable summary for a non-technical audience. Include:\n"
-            f"- The dataset name (no file paths): {dataset_str}\n"
+            "You are a third-party privacy auditor. Given the following dataset and its privacy scan results, generate a clear, actionable, and human-readable summary for a non-technical audience. Include:\n"
+            "- The dataset name (no file paths)\n"
             "- Any privacy risks or flags, with a brief explanation\n"
             "- Recommended actions (if any)\n"
             "- Model Context Protocol findings: k-anonymity, l-diversity, t-closeness, re-identification risk, and the threshold values used\n"
@@ -442,7 +550,9 @@ class SummariserAgent(LlmAgent):
             "Dataset and results:\n"
         )
 
-        block = ""
+        # Accumulate the block in a list and join once; repeated += on a
+        # string re-copies the whole prefix on every append.
+        block_parts = [f"Dataset name (no file paths): {dataset_str}\n"]
         # Add validator results (only key fields)
         try:
             v = json.loads(validation_result) if isinstance(validation_result, str) else validation_result
@@ -453,127 +563,125 @@ class SummariserAgent(LlmAgent):
         except Exception:
             scan = {}
 
-        # Robustly extract MCP findings from either top-level or nested dict
-        import datetime
-        import json as _json
-        # Prefer nested 'validation_result' if present, else use v itself
-        mcp_debug = v.get('validation_result') if isinstance(v, dict) and 'validation_result' in v else v
-        if isinstance(mcp_debug, str):
-            try:
-                mcp_debug = _json.loads(mcp_debug)
-            except Exception:
-                mcp_debug = None
-        debug_msg = f"[DEBUG {datetime.datetime.now()}] MCP findings (pre-summary): { _json.dumps(mcp_debug, indent=2) }\n"
-        if log_event:
-            log_event(debug_msg)
-        else:
-            log_path = log_file_path or 'log.txt'
-            try:
-                with open(log_path, 'a') as logf:
-                    logf.write(debug_msg)
-            except Exception:
-                pass
-
-        # Extract MCP findings robustly
-        flags = v.get('flags', []) if isinstance(v, dict) else []
-        recs = v.get('recommendations', []) if isinstance(v, dict) else []
-        # Use nested 'validation_result' if present, else v itself
+        # Robustly extract MCP findings from either top-level or nested dict.
+        # Parse the nested payload exactly once at this boundary; the debug
+        # log and the extraction below share the same parsed dict.
         mcp = v.get('validation_result') if isinstance(v, dict) and 'validation_result' in v else v
         if isinstance(mcp, str):
             try:
                 mcp = json.loads(mcp)
             except Exception:
                 mcp = None
+        # Buffer log lines for the whole run and flush with one append at the
+        # end instead of an open/write/close per event. Pretty-printed MCP
+        # dumps only get built when debug logging is enabled.
+        log_lines = []
+        if _DEBUG_LOG:
+            debug_msg = f"[DEBUG {datetime.datetime.now()}] MCP findings (pre-summary): { json.dumps(mcp, indent=2) }\n"
+            if log_event:
+                log_event(debug_msg)
+            else:
+                log_lines.append(debug_msg)
+
+        # Extract MCP findings robustly
+        flags = v.get('flags', []) if isinstance(v, dict) else []
+        recs = v.get('recommendations', []) if isinstance(v, dict) else []
         risk_flags = []
         repair_suggestions = []
         if mcp:
             risk_flags = mcp.get('risk_flags', [])
             repair_suggestions = mcp.get('repair_suggestions', [])
 
-        block += f"Flags: {truncate(str(flags), 300)}\n"
-        block += f"Recommendations: {truncate(str(recs), 300)}\n"
-        block += f"Risk Flags: {truncate(str(risk_flags), 300)}\n"
-        block += f"Repair Suggestions: {truncate(str(repair_suggestions), 300)}\n"
-
-        # Always require thresholds, fallback to QI/sensitive count if missing, and robustly extract real metric values
-        def safe_metric(val):
-            if val is None or (isinstance(val, float) and (val != val)):
-                return 'not calculated'
-            return val
-        def infer_threshold(val, fallback):
-            return val if val not in (None, '', 'N/A') else fallback
-
-
-        def robust_metric(val):
-            # Return 'not calculated' for None, empty string, empty list, or NaN, else the value
-            if val is None:
-                return 'not calculated'
-            if isinstance(val, str) and val.strip() == '':
-                return 'not calculated'
-            if isinstance(val, (list, dict)) and len(val) == 0:
-                return 'not calculated'
-            if isinstance(val, float) and (val != val):
-                return 'not calculated'
-            return val
-
-        k = mcp.get('k_anonymity', {}) if mcp else {}
-        l = mcp.get('l_diversity', {}) if mcp else {}
-        t = mcp.get('t_closeness', {}) if mcp else {}
-        params = mcp.get('params', {}) if mcp else {}
-        qi_count = len(scan.get('quasi_identifiers', [])) if scan else 'N/A'
-        sensitive_count = len(scan.get('sensitive', [])) if scan else 'N/A'
-        k_req = robust_metric(params.get('k_required')) if params.get('k_required') not in (None, '', 'N/A') else qi_count if qi_count != 0 else 'N/A'
-        l_req = robust_metric(params.get('l_required')) if params.get('l_required') not in (None, '', 'N/A') else sensitive_count if sensitive_count != 0 else 'N/A'
-        t_req = robust_metric(params.get('t_required')) if params.get('t_required') not in (None, '', 'N/A') else 0.2
-        reid_req = robust_metric(params.get('reid_required')) if params.get('reid_required') not in (None, '', 'N/A') else 0.05
-
-        block += "Model Context Protocol Findings:\n"
-        block += f"- k-anonymity: {robust_metric(k.get('k_min')) if k.get('k_min') is not None else 'Not calculated'}. "
-        block += f"The minimum group size was {robust_metric(k.get('k_min'))}, average was {robust_metric(k.get('k_avg'))}, required threshold: {k_req}.\n"
-        block += f"- l-diversity: {robust_metric(l.get('l_min')) if l.get('l_min') is not None else 'Not calculated'}. "
-        block += f"The minimum diversity was {robust_metric(l.get('l_min'))}, average was {robust_metric(l.get('l_avg'))}, method: {robust_metric(l.get('method'))}, required threshold: {l_req}.\n"
-        block += f"- t-closeness: {robust_metric(t.get('t_max')) if t.get('t_max') is not None else 'Not calculated'}. "
-        block += f"The maximum closeness was {robust_metric(t.get('t_max'))}, average was {robust_metric(t.get('t_avg'))}, method: {robust_metric(t.get('method'))}, required threshold: {t_req}.\n"
-        block += f"- Re-identification risk: {reid_req if reid_req is not None else 'Not calculated'}. "
-        block += f"The dataset was evaluated against a risk threshold of {reid_req}.\n"
-        # Always extract QI and sensitive columns from MCP findings params['qi'] and params['sensitive'] if present
+        block_parts.append(f"Flags: {_truncate_value(flags, 300)}\n")
+        block_parts.append(f"Recommendations: {_truncate_value(recs, 300)}\n")
+        block_parts.append(f"Risk Flags: {_truncate_value(risk_flags, 300)}\n")
+        block_parts.append(f"Repair Suggestions: {_truncate_value(repair_suggestions, 300)}\n")
+
+        # Always require thresholds, fallback to QI/sensitive count if missing,
+        # and robustly extract real metric values via the module-level helpers.
+        # Without MCP findings there is nothing to extract: emit a compact
+        # placeholder instead of walking empty dicts for every metric.
         qis = []
         sensitive = []
-        if params:
-            qis = params.get('qi', [])
-            sensitive = params.get('sensitive', [])
+        if mcp:
+            k = mcp.get('k_anonymity', {})
+            l = mcp.get('l_diversity', {})
+            t = mcp.get('t_closeness', {})
+            params = mcp.get('params', {})
+            qi_count = len(scan.get('quasi_identifiers', [])) if scan else 'N/A'
+            sensitive_count = len(scan.get('sensitive', [])) if scan else 'N/A'
+            # Fetch each threshold once; the guard and the formatted value
+            # share the same lookup
+            kr, lr, tr, rr = (params.get('k_required'), params.get('l_required'),
+                              params.get('t_required'), params.get('reid_required'))
+            k_req = _robust_metric(kr) if kr not in _MISSING else qi_count if qi_count != 0 else 'N/A'
+            l_req = _robust_metric(lr) if lr not in _MISSING else sensitive_count if sensitive_count != 0 else 'N/A'
+            t_req = _robust_metric(tr) if tr not in _MISSING else 0.2
+            reid_req = _robust_metric(rr) if rr not in _MISSING else 0.05
+
+            # Evaluate each metric once, then fill the fixed template in a single pass
+            k_min = _robust_metric(k.get('k_min'))
+            l_min = _robust_metric(l.get('l_min'))
+            t_max = _robust_metric(t.get('t_max'))
+            block_parts.append(_MCP_FINDINGS_TEMPLATE.format_map({
+                'k_min_disp': k_min if k.get('k_min') is not None else 'Not calculated',
+                'k_min': k_min,
+                'k_avg': _robust_metric(k.get('k_avg')),
+                'k_req': k_req,
+                'l_min_disp': l_min if l.get('l_min') is not None else 'Not calculated',
+                'l_min': l_min,
+                'l_avg': _robust_metric(l.get('l_avg')),
+                'l_method': _robust_metric(l.get('method')),
+                'l_req': l_req,
+                't_max_disp': t_max if t.get('t_max') is not None else 'Not calculated',
+                't_max': t_max,
+                't_avg': _robust_metric(t.get('t_avg')),
+                't_method': _robust_metric(t.get('method')),
+                't_req': t_req,
+                'reid_disp': reid_req if reid_req is not None else 'Not calculated',
+                'reid_req': reid_req,
+            }))
+            # Always extract QI and sensitive columns from MCP findings params['qi'] and params['sensitive'] if present
+            if params:
+                qis = params.get('qi', [])
+                sensitive = params.get('sensitive', [])
+        else:
+            block_parts.append("Model Context Protocol Findings: not calculated\n")
         if not qis and scan:
             qis = scan.get('quasi_identifiers', [])
         if not sensitive and scan:
             sensitive = scan.get('sensitive', [])
-        debug_cols_msg = f"[DEBUG] QI columns passed to summary: {qis}\n[DEBUG] Sensitive columns passed to summary: {sensitive}\n"
-        if log_event:
-            log_event(debug_cols_msg)
-        else:
+        if _DEBUG_LOG:
+            debug_cols_msg = f"[DEBUG] QI columns passed to summary: {qis}\n[DEBUG] Sensitive columns passed to summary: {sensitive}\n"
+            if log_event:
+                log_event(debug_cols_msg)
+            else:
+                log_lines.append(debug_cols_msg)
+        block_parts.append(f"Quasi-Identifiers: {_truncate_value(qis, 200)}\n")
+        block_parts.append(f"Sensitive Columns: {_truncate_value(sensitive, 200)}\n")
+        block = _truncate(''.join(block_parts), MAX_BLOCK)
+
+        prompt = ''.join((
+            prompt,
+            block,
+            "\nFormat the summary as a third-party privacy assessment for another party's system. "
+            "Be concise, use plain language, and make the findings easy to understand for non-technical stakeholders.\n"
+            "Do not include any date, 'To:', 'From:', or formal letter headers in the summary.\n",
+        ))
+
+        # The full prompt dump can be many KB; only build and persist it (and
+        # flush any buffered debug lines) when debug logging is enabled
+        if _DEBUG_LOG:
+            if log_event:
+                log_event(f"[SummariserAgent] Prompt to LLM: {prompt}")
+            log_lines.append(f"[SummariserAgent] Prompt to LLM: {prompt}\n")
+        if log_lines:
             log_path = log_file_path or 'log.txt'
             try:
                 with open(log_path, 'a') as logf:
-                    logf.write(debug_cols_msg)
+                    logf.write("".join(log_lines))
             except Exception:
                 pass
-        block += f"Quasi-Identifiers: {truncate(str(qis), 200)}\n"
-        block += f"Sensitive Columns: {truncate(str(sensitive), 200)}\n"
-        block = truncate(block, MAX_BLOCK)
-
-        prompt += block
-        prompt += ("\nFormat the summary as a third-party privacy assessment for another party's system. "
-                   "Be concise, use plain language, and make the findings easy to understand for non-technical stakeholders.\n"
-                   "Do not include any date, 'To:', 'From:', or formal letter headers in the summary.\n")
-
-        if log_event:
-            log_event(f"[SummariserAgent] Prompt to LLM: {prompt}")
-        # Always write prompt to log.txt for persistent debug
-        log_path = log_file_path or 'log.txt'
-        try:
-            with open(log_path, 'a') as logf:
-                logf.write(f"[SummariserAgent] Prompt to LLM: {prompt}\n")
-        except Exception:
-            pass
         try:
             summary = gemma_client.summarise_privacy_report(prompt)
         except Exception as e:
@@ -582,27 +690,74 @@ class SummariserAgent(LlmAgent):
             log_event(f"[SummariserAgent] Output for {dataset_path}: {summary}")
         return {"summary": summary}
 
+# Agent cards rarely change; cache them on disk with a TTL so restarting the
+# orchestrator skips the discovery round-trips (same pattern as the column
+# roles cache in gemma_client).
+_AGENT_CARD_CACHE_PATH = os.path.join(os.path.dirname(__file__), ".agent_cards_cache.json")
+_AGENT_CARD_CACHE_TTL = float(os.getenv("AGENT_CARD_CACHE_TTL", "3600"))
+
+# Results root is a pure function of the module location; resolve it once at
+# import instead of rebuilding (and abspath-ing) it on every run()
+_RESULTS_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'results'))
+_LOG_FILENAME = "log.txt"
+
 class OrchestratorAgent:
     def __init__(self):
         """
         OrchestratorAgent coordinates the workflow between ValidatorAgent, ScannerAgent, and SummariserAgent.
         Discovers agent endpoints and aggregates results.
         """
-        import requests
         self.agent_services = {
             "validator": "http://localhost:8001",
             "scanner": "http://localhost:8002",
             "summariser": "http://localhost:8003"
         }
+        # Persistent session so keep-alive reuses sockets across the
+        # scanner -> validator -> summariser hops instead of paying TCP
+        # setup per request.
+        self.session = requests.Session()
+        self.session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+        # Most-recent results directory, resolved lazily on first run()
+        self._resolved_log_dir = None
         self.agent_cards = {}
-        # Discover agent cards
-        errors = []
+        # Serve cards from the disk cache when fresh; only the misses go out
+        # over the network (concurrently, so the round-trips overlap instead
+        # of paying each service's latency in sequence)
+        now = time.time()
+        try:
+            with open(_AGENT_CARD_CACHE_PATH) as f:
+                card_cache = json.load(f)
+        except Exception:
+            card_cache = {}
+        to_fetch = {}
         for name, url in self.agent_services.items():
+            entry = card_cache.get(url)
+            if entry and now - entry.get("ts", 0) < _AGENT_CARD_CACHE_TTL:
+                self.agent_cards[name] = entry["card"]
+            else:
+                to_fetch[name] = url
+        errors = []
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=len(to_fetch)) as pool:
+                futures = {
+                    name: pool.submit(self.session.get, f"{url}/.well-known/agent.json", timeout=10)
+                    for name, url in to_fetch.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        card = future.result().json()
+                        self.agent_cards[name] = card
+                        card_cache[self.agent_services[name]] = {"ts": now, "card": card}
+                    except Exception as e:
+                        errors.append(f"{name}: {e}")
+            # Persist the refreshed cache atomically; best-effort only
             try:
-                card = requests.get(f"{url}/.well-known/agent.json").json()
-                self.agent_cards[name] = card
-            except Exception as e:
-                errors.append(f"{name}: {e}")
+                tmp_path = _AGENT_CARD_CACHE_PATH + ".tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(card_cache, f)
+                os.replace(tmp_path, _AGENT_CARD_CACHE_PATH)
+            except Exception:
+                pass
         if len(self.agent_cards) < len(self.agent_services):
             raise RuntimeError(f"Agent card discovery failed for: {', '.join(errors)}. Ensure all agent services are running.")
 
@@ -611,41 +766,46 @@ class OrchestratorAgent:
         Run the full privacy validation, scanning, and summarisation workflow for a dataset.
         Returns validation, scan, and summary results. Logs workflow events.
         """
-        import requests
-        import json
-        import os
-        from datetime import datetime
-        import glob
-        # If log_dir is not provided, use the most recent results/<timestamp> directory
+        # If log_dir is not provided, use the most recent results/<timestamp>
+        # directory. Resolved once per process: a single os.scandir pass
+        # (names sort as timestamps) memoised on self, instead of a glob +
+        # per-entry isdir on every run.
         if log_dir is None:
-            results_root = os.path.join(os.path.dirname(__file__), '../results')
-            results_root = os.path.abspath(results_root)
-            subdirs = [d for d in glob.glob(os.path.join(results_root, '*/')) if os.path.isdir(d)]
-            if subdirs:
-                # Sort by timestamp descending
-                subdirs.sort(reverse=True)
-                log_dir = subdirs[0].rstrip('/')
-            else:
+            log_dir = self._resolved_log_dir
+        if log_dir is None:
+            try:
+                with os.scandir(_RESULTS_ROOT) as it:
+                    log_dir = max((e.path for e in it if e.is_dir()), default=None)
+            except OSError:
+                log_dir = None
+            if log_dir is None:
                 # Fallback: create a new timestamped directory
-                log_dir = os.path.join(results_root, datetime.now().strftime('results/%Y-%m-%dT%H-%M-%S-%fZ'))
+                log_dir = os.path.join(_RESULTS_ROOT, datetime.datetime.now().strftime('results/%Y-%m-%dT%H-%M-%S-%fZ'))
+            self._resolved_log_dir = log_dir
         logs = []
         def log_event_local(event):
-            logs.append(f"{datetime.now().isoformat()} {event}")
+            logs.append(f"{datetime.datetime.now().isoformat()} {event}")
             if log_event:
                 log_event(event)
 
         def safe_post(url, payload, agent_name):
             try:
-                resp = requests.post(url, json=payload)
+                # Serialise/parse with orjson when installed; scan_result
+                # payloads are large and this path runs once per agent hop
+                if orjson is not None:
+                    resp = self.session.post(url, data=orjson.dumps(payload),
+                                             headers={"Content-Type": "application/json"})
+                else:
+                    resp = self.session.post(url, json=payload)
                 log_event_local(f"POST {agent_name} {url} payload={payload} status={resp.status_code}")
                 if resp.status_code != 200:
                     log_event_local(f"{agent_name} error: {resp.text}")
                     return {"error": f"{agent_name} returned status {resp.status_code}", "response": resp.text}
                 try:
-                    result = resp.json()
+                    result = orjson.loads(resp.content) if orjson is not None else resp.json()
                     log_event_local(f"{agent_name} response: {result}")
                     return result
-                except json.JSONDecodeError:
+                except ValueError:
                     log_event_local(f"{agent_name} invalid JSON: {resp.text}")
                     return {"error": f"{agent_name} returned invalid JSON", "response": resp.text}
             except Exception as e:
@@ -656,21 +816,21 @@ class OrchestratorAgent:
         # A2A: POST to scanner FIRST
         scanner_url = self.agent_services["scanner"] + self.agent_cards["scanner"]["endpoint"]
         # Pass log_file_path to agents
-        log_file_path = os.path.join(log_dir, "log.txt") if log_dir else "log.txt"
+        log_file_path = os.path.join(log_dir, _LOG_FILENAME) if log_dir else _LOG_FILENAME
         scan = safe_post(scanner_url, {"dataset": dataset, "dataset_path": dataset_path, "log_file_path": log_file_path}, "scanner")
 
-        # Extract QI and sensitive columns for this dataset
+        # Extract QI and sensitive columns for this dataset via a basename
+        # index instead of re-scanning the discovered list per lookup
         qi_cols = None
         sensitive_col = None
         if scan and "discovered_datasets" in scan:
-            # Find the entry for this dataset
-            for entry in scan["discovered_datasets"]:
-                if (entry.get("path") == dataset_path) or (os.path.basename(entry.get("path","")) == os.path.basename(dataset_path)):
-                    qis = entry.get("quasi_identifiers", [])
-                    sens = entry.get("sensitive", [])
-                    qi_cols = qis if qis else None
-                    sensitive_col = sens[0] if sens else None
-                    break
+            by_base = {os.path.basename(e.get("path", "")): e for e in scan["discovered_datasets"]}
+            entry = by_base.get(os.path.basename(dataset_path or ""))
+            if entry is not None:
+                qis = entry.get("quasi_identifiers", [])
+                sens = entry.get("sensitive", [])
+                qi_cols = qis if qis else None
+                sensitive_col = sens[0] if sens else None
 
         # A2A: POST to validator, passing QI and sensitive if found
         validator_url = self.agent_services["validator"] + self.agent_cards["validator"]["endpoint"]
@@ -680,8 +840,10 @@ class OrchestratorAgent:
         if sensitive_col:
             validator_payload["sensitive_col"] = sensitive_col
         validation = safe_post(validator_url, validator_payload, "validator")
-        # Debug: log raw validator response
-        log_event_local(f"[DEBUG] Raw validator response: {json.dumps(validation, default=str)}")
+        # Debug: log raw validator response (serialising the whole response
+        # is only worth paying for when debug logging is on)
+        if _DEBUG_LOG:
+            log_event_local(f"[DEBUG] Raw validator response: {json.dumps(validation, default=str)}")
         # Ensure validation_result is a dict, never None or string
         val_result = validation.get("validation_result", validation)
         if isinstance(val_result, str):
@@ -694,21 +856,30 @@ class OrchestratorAgent:
             log_event_local(f"[WARN] validation_result is not a dict or is None. Value: {val_result}")
         # A2A: POST to summariser
         summariser_url = self.agent_services["summariser"] + self.agent_cards["summariser"]["endpoint"]
+        # Pass the parsed dicts straight through; requests serialises the
+        # payload once and SummariserAgent.run accepts dict or string, so
+        # there is no point dumping to JSON strings it would re-parse.
         summary = safe_post(summariser_url, {
             "datasets": [dataset_path],
             "results": {
-                "validation_result": json.dumps(val_result, ensure_ascii=False),
-                "scan_result": json.dumps(scan.get("scan_result", scan), ensure_ascii=False)
+                "validation_result": val_result,
+                "scan_result": scan.get("scan_result", scan)
             },
             "log_file_path": log_file_path
         }, "summariser")
         log_event_local(f"[OrchestratorAgent] Finished workflow for {dataset_path}")
-        # Write logs to log.txt in the scan's timestamp folder
-        if log_dir:
+        # Write logs to log.txt in the scan's timestamp folder. One raw
+        # O_APPEND write of the joined buffer: no per-line buffering layer,
+        # and POSIX append semantics keep concurrent workers from
+        # interleaving mid-buffer.
+        if log_dir and logs:
             os.makedirs(log_dir, exist_ok=True)
-            with open(os.path.join(log_dir, "log.txt"), "a") as f:
-                for line in logs:
-                    f.write(line + "\n")
+            fd = os.open(os.path.join(log_dir, _LOG_FILENAME),
+                         os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, ("\n".join(logs) + "\n").encode())
+            finally:
+                os.close(fd)
         return {
             "validation": validation,
             "scan": scan,
@@ -5,37 +5,105 @@ Implements k-anonymity, l-diversity, t-closeness, and linkage attack simulation.
 Provides full privacy risk report and threshold suggestions for datasets.
 """
 
+import copy
+import logging
 import os
 import tempfile
 import math
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Mapping, Optional, Union
 from dataclasses import dataclass
 
 import numpy as np
 import pandas as pd
-from scipy.stats import chi2_contingency, wasserstein_distance  # For categorical association and EMD
+from scipy.stats import wasserstein_distance  # For EMD
+from scipy.stats import chi2 as chi2_dist  # Survival function for the association p-value
+
+try:
+    # Optional: JIT-compile the numeric kernels below when numba is installed.
+    # The pandas groupby machinery in full_report cannot be JIT-compiled, but
+    # the per-group entropy/TVD kernels are plain NumPy and benefit on large
+    # datasets. Everything works identically without numba.
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
 
 # -----------------------------
 # Utility Functions
 # -----------------------------
-def _safe_entropy(p: np.ndarray) -> float:
-    """
-    Compute Shannon entropy (base-2) for distribution p (ignoring zero probabilities).
-    """
+def _entropy_kernel(p: np.ndarray) -> float:
     p = p[p > 0]
     if p.size == 0:
         return 0.0
     return float(-(p * np.log2(p)).sum())
 
+def _tvd_kernel(p: np.ndarray, q: np.ndarray) -> float:
+    p_sum = p.sum()
+    q_sum = q.sum()
+    if p_sum > 0:
+        p = p / p_sum
+    if q_sum > 0:
+        q = q / q_sum
+    return 0.5 * np.abs(p - q).sum()
+
+if njit is not None:
+    _entropy_kernel = njit(cache=True)(_entropy_kernel)
+    _tvd_kernel = njit(cache=True)(_tvd_kernel)
+
+    # Group-wise reductions over the (group x category/bin) count matrices
+    # built in t_closeness / l_diversity. The explicit loops compile to tight
+    # machine code and skip the temporaries the NumPy fallback allocates.
+    @njit(cache=True)
+    def _groupwise_tvd_kernel(counts, global_probs):
+        ngroups, nbins = counts.shape
+        out = np.empty(ngroups)
+        for g in range(ngroups):
+            total = 0.0
+            for b in range(nbins):
+                total += counts[g, b]
+            acc = 0.0
+            if total > 0:
+                for b in range(nbins):
+                    acc += abs(counts[g, b] / total - global_probs[b])
+            else:
+                for b in range(nbins):
+                    acc += global_probs[b]
+            out[g] = 0.5 * acc
+        return out
+
+    @njit(cache=True)
+    def _groupwise_entropy_kernel(counts):
+        ngroups, nsens = counts.shape
+        out = np.empty(ngroups)
+        for g in range(ngroups):
+            total = 0.0
+            for j in range(nsens):
+                total += counts[g, j]
+            h = 0.0
+            if total > 0:
+                for j in range(nsens):
+                    c = counts[g, j]
+                    if c > 0:
+                        p = c / total
+                        h -= p * np.log2(p)
+            out[g] = h
+        return out
+else:
+    _groupwise_tvd_kernel = None
+    _groupwise_entropy_kernel = None
+
+def _safe_entropy(p: np.ndarray) -> float:
+    """
+    Compute Shannon entropy (base-2) for distribution p (ignoring zero probabilities).
+    """
+    return float(_entropy_kernel(np.asarray(p, dtype=float)))
+
 def _total_variation_distance(p: np.ndarray, q: np.ndarray) -> float:
     """
     Compute Total Variation Distance (TVD) between two distributions.
     """
-    p = np.asarray(p, dtype=float)
-    q = np.asarray(q, dtype=float)
-    p = p / p.sum() if p.sum() > 0 else p
-    q = q / q.sum() if q.sum() > 0 else q
-    return 0.5 * np.abs(p - q).sum()
+    return float(_tvd_kernel(np.asarray(p, dtype=float), np.asarray(q, dtype=float)))
 
 def _emd_distance(p_values: np.ndarray, q_values: np.ndarray) -> float:
     """
@@ -43,30 +111,74 @@ def _emd_distance(p_values: np.ndarray, q_values: np.ndarray) -> float:
     """
     return float(wasserstein_distance(p_values, q_values))
 
-def simulate_linkage_attack(anonymised_df: pd.DataFrame, aux_df: pd.DataFrame, qi_cols: List[str]) -> Dict[str, Any]:
+def simulate_linkage_attack(anonymised_df: pd.DataFrame, aux_df: Union[pd.DataFrame, Mapping], qi_cols: List[str]) -> Dict[str, Any]:
     """
     Simulate a robust linkage attack (row-level):
     - Unique: aux record maps to exactly 1 row in anonymised_df
     - Multiple: aux record maps to more than 1 row
     - None: aux record maps to 0 rows
     Returns counts, flagged aux rows that had unique match, and re-identification probability.
-    """
-    aux = aux_df.copy().reset_index(drop=False).rename(columns={"index": "__aux_id__"})
-    merged = aux.merge(anonymised_df, on=qi_cols, how="left", indicator=True)
-    counts = merged.groupby("__aux_id__")["_merge"].apply(lambda s: (s == "both").sum())
 
-    unique = int((counts == 1).sum())
-    multiple = int((counts > 1).sum())
-    none = int((counts == 0).sum())
-    flagged = aux.loc[counts[counts == 1].index].drop(columns="__aux_id__", errors="ignore").to_dict("records")
-    reid_prob = float(unique / len(aux)) if len(aux) else 0.0
+    aux_df may be a DataFrame or a mapping of column name to array; the
+    mapping fast path joins per-column codes directly and never builds a
+    pandas frame for the auxiliary records.
+    """
+    aux_arrays = None
+    if isinstance(aux_df, Mapping) and not isinstance(aux_df, pd.DataFrame):
+        aux_arrays = {c: np.asarray(aux_df[c]) for c in qi_cols}
+        n_aux = len(next(iter(aux_arrays.values()))) if aux_arrays else 0
+    else:
+        n_aux = len(aux_df)
+    if n_aux == 0:
+        return {
+            "unique": 0, "multiple": 0, "none": 0, "flagged": [],
+            "records_tested": 0, "reid_probability": 0.0,
+        }
+    # Hash-join on QI codes: factorise both frames' QI tuples into one code
+    # space, count anonymised rows per code with bincount, and index those
+    # counts by the aux codes. O(N_aux + N_anon) with no wide merge frame.
+    if aux_arrays is not None:
+        # Per-column factorize over concatenated arrays, combined with
+        # ravel_multi_index into one code space.
+        col_codes, dims = [], []
+        for c in qi_cols:
+            cc, uniques = pd.factorize(
+                np.concatenate([np.asarray(anonymised_df[c]), aux_arrays[c]]),
+                use_na_sentinel=False,
+            )
+            col_codes.append(cc)
+            dims.append(len(uniques))
+        codes = col_codes[0] if len(qi_cols) == 1 else np.ravel_multi_index(col_codes, dims)
+    else:
+        combined = pd.concat([anonymised_df[qi_cols], aux_df[qi_cols]], ignore_index=True)
+        if len(qi_cols) == 1:
+            codes, _ = pd.factorize(combined[qi_cols[0]], use_na_sentinel=False)
+        else:
+            codes, _ = pd.factorize(pd.MultiIndex.from_frame(combined), use_na_sentinel=False)
+    anon_codes = codes[: len(anonymised_df)]
+    aux_codes = codes[len(anonymised_df):]
+    match_counts = np.bincount(anon_codes, minlength=int(codes.max()) + 1)[aux_codes]
+
+    unique = int((match_counts == 1).sum())
+    multiple = int((match_counts > 1).sum())
+    none = int((match_counts == 0).sum())
+    flagged_idx = np.flatnonzero(match_counts == 1)
+    if aux_arrays is not None:
+        flagged = [
+            {c: aux_arrays[c][i].tolist() if isinstance(aux_arrays[c][i], np.generic) else aux_arrays[c][i]
+             for c in qi_cols}
+            for i in flagged_idx
+        ]
+    else:
+        flagged = aux_df.iloc[flagged_idx].to_dict("records")
+    reid_prob = float(unique / n_aux)
 
     return {
         "unique": unique,
         "multiple": multiple,
         "none": none,
         "flagged": flagged,
-        "records_tested": len(aux),
+        "records_tested": n_aux,
         "reid_probability": reid_prob,
     }
 
@@ -96,28 +208,58 @@ class TClosenessReport:
     bins: Optional[List[float]] = None
     method: str = "tvd"
 
+# Fixed repair-suggestion text, interned once at import. Flag strings stay
+# inline f-strings: they carry the measured values and are only formatted
+# when a threshold is actually breached.
+_REPAIR_L_ENTROPY = "Consider generalising QIs or grouping sensitive values to increase entropy."
+_REPAIR_L_DISTINCT = "Consider generalising QIs to increase diversity."
+_REPAIR_T = "Consider generalising QIs or binning sensitive variable differently."
+_REPAIR_REID = "Consider suppressing unique QI combinations or generalising QIs."
+
 # -----------------------------
 # Core Validator
 # -----------------------------
 class AnonymisationValidator:
 
-    def l_diversity(self, qi_cols: List[str], sensitive_col: str, method: str = "distinct") -> LDiversityReport:
+    def l_diversity(self, qi_cols: List[str], sensitive_col: str, method: str = "distinct",
+                    grouped=None) -> LDiversityReport:
         """
         Compute l-diversity for the given quasi-identifier columns and sensitive attribute.
         method: 'distinct' (default) or 'entropy'.
+        An existing QI groupby can be passed to avoid re-hashing the QI columns.
         Returns an LDiversityReport dataclass.
         """
-        grp = self.df.groupby(qi_cols, dropna=False)[sensitive_col]
+        if grouped is None:
+            grouped = self.df.groupby(qi_cols, dropna=False, observed=True, sort=False)
+        grp = grouped[sensitive_col]
         if method == "distinct":
             l_values = grp.nunique(dropna=False)
             l_min = float(l_values.min()) if len(l_values) else 0.0
             l_avg = float(l_values.mean()) if len(l_values) else 0.0
             return LDiversityReport(method=method, l_min=l_min, l_avg=l_avg)
         elif method == "entropy":
-            probs = grp.value_counts(normalize=True, dropna=False)
-            entropies = probs.groupby(level=list(range(len(qi_cols)))).apply(lambda p: _safe_entropy(p.values))
-            entropy_min = float(entropies.min()) if len(entropies) else 0.0
-            entropy_avg = float(entropies.mean()) if len(entropies) else 0.0
+            # One bincount over (group code, sensitive code) builds the full
+            # per-group distribution matrix; group entropies then come from a
+            # single fused NumPy expression instead of a Python callback per
+            # equivalence class.
+            gcodes = grouped.ngroup().to_numpy()
+            scodes, scats = pd.factorize(self.df[sensitive_col], use_na_sentinel=False)
+            ngroups = int(gcodes.max()) + 1 if len(gcodes) else 0
+            nsens = len(scats)
+            if ngroups and nsens:
+                counts = np.bincount(gcodes * nsens + scodes, minlength=ngroups * nsens)
+                counts = counts.reshape(ngroups, nsens).astype(float)
+                if _groupwise_entropy_kernel is not None:
+                    entropies = _groupwise_entropy_kernel(counts)
+                else:
+                    p = counts / counts.sum(axis=1, keepdims=True)
+                    logp = np.log2(p, out=np.zeros_like(p), where=p > 0)
+                    entropies = -(p * logp).sum(axis=1)
+                entropy_min = float(entropies.min())
+                entropy_avg = float(entropies.mean())
+            else:
+                entropy_min = 0.0
+                entropy_avg = 0.0
             entropy_eff_min = float(2 ** entropy_min)
             entropy_eff_avg = float(2 ** entropy_avg)
             distinct_l = grp.nunique(dropna=False)
@@ -135,12 +277,14 @@ class AnonymisationValidator:
         else:
             raise ValueError("method must be 'distinct' or 'entropy'")
 
-    def k_anonymity(self, qi_cols: List[str]) -> KAnonymityReport:
+    def k_anonymity(self, qi_cols: List[str], grouped=None) -> KAnonymityReport:
         """
         Compute k-anonymity statistics for the given quasi-identifier columns.
+        An existing QI groupby can be passed to avoid re-hashing the QI columns.
         Returns a KAnonymityReport dataclass with min, avg, and equivalence class size histogram.
         """
-        grouped = self.df.groupby(qi_cols, dropna=False)
+        if grouped is None:
+            grouped = self.df.groupby(qi_cols, dropna=False, observed=True, sort=False)
         eq_class_sizes = grouped.size()
         k_min = int(eq_class_sizes.min()) if len(eq_class_sizes) else 0
         k_avg = float(eq_class_sizes.mean()) if len(eq_class_sizes) else 0.0
@@ -153,6 +297,9 @@ class AnonymisationValidator:
             df (pd.DataFrame): The dataset to validate for anonymisation.
         """
         self.df = df
+        # full_report results memoised by data fingerprint + parameters;
+        # interactive UIs re-request the same report repeatedly.
+        self._report_cache: Dict[Any, Dict[str, Any]] = {}
     def suggest_thresholds(self, qi_cols, sensitive_col):
         """
         Suggest k, l, t, and re-identification thresholds based on dataset size and column types.
@@ -198,59 +345,73 @@ class AnonymisationValidator:
         numeric_bins: int = 10,
         binning_method: str = "fd",
         t_method: str = "tvd",
+        grouped=None,
     ) -> TClosenessReport:
         """
         Compute t-closeness for numeric or categorical sensitive attributes.
         t_method: 'tvd' (default) or 'emd' (Earth Mover's Distance)
+        An existing QI groupby can be passed to avoid re-hashing the QI columns.
         Returns a TClosenessReport dataclass.
         """
         s = self.df[sensitive_col]
         bins = None
+        if grouped is None:
+            grouped = self.df.groupby(qi_cols, dropna=False, observed=True, sort=False)
 
         if pd.api.types.is_numeric_dtype(s):
             x = s.dropna()
             if x.empty:
-                global_dist = np.array([])
-                def dist_func(subs: pd.Series) -> float:
-                    return 0.0
+                return TClosenessReport(t_max=0.0, t_avg=0.0, bins=None, method=t_method)
+            if binning_method == "quantile":
+                quantiles = np.linspace(0, 1, numeric_bins + 1)
+                bins = np.unique(np.quantile(x, quantiles))
             else:
-                    if binning_method == "quantile":
-                        quantiles = np.linspace(0, 1, numeric_bins + 1)
-                        bins = np.unique(np.quantile(x, quantiles))
-                    else:
-                        x_max = x.max()
-                        x_min = x.min()
-                        if np.isnan(x_max) or np.isnan(x_min):
-                            # All values are NaN, skip calculation
-                            bins = None
-                            global_counts = np.array([])
-                            global_probs = np.array([])
-                            def dist_func(subs: pd.Series) -> float:
-                                return 0.0
-                        else:
-                            iqr = np.subtract(*np.percentile(x, [75, 25]))
-                            h = 2 * iqr * (len(x) ** (-1/3)) if iqr > 0 else (x_max - x_min) / max(1, numeric_bins)
-                            # Prevent division by zero or NaN
-                            if h == 0 or np.isnan(h):
-                                h = 1
-                            bin_count = max(1, int(np.ceil((x_max - x_min) / h)))
-                            bins = np.histogram_bin_edges(x, bins=bin_count)
-                            global_counts, _ = np.histogram(x, bins=bins)
-                            global_probs = global_counts / global_counts.sum() if global_counts.sum() > 0 else global_counts
-                            def dist_func(subs: pd.Series) -> float:
-                                if t_method == "emd":
-                                    return _emd_distance(subs.dropna().values, x.values)
-                                counts, _ = np.histogram(subs.dropna(), bins=bins)
-                                p = counts / counts.sum() if counts.sum() > 0 else counts
-                                return _total_variation_distance(p, global_probs)
+                x_max = x.max()
+                x_min = x.min()
+                iqr = np.subtract(*np.percentile(x, [75, 25]))
+                h = 2 * iqr * (len(x) ** (-1/3)) if iqr > 0 else (x_max - x_min) / max(1, numeric_bins)
+                # Prevent division by zero or NaN
+                if h == 0 or np.isnan(h):
+                    h = 1
+                bin_count = max(1, int(np.ceil((x_max - x_min) / h)))
+                bins = np.histogram_bin_edges(x, bins=bin_count)
+            if t_method == "emd":
+                # EMD has no closed per-group histogram form; keep the apply path
+                t_values = grouped[sensitive_col].apply(
+                    lambda subs: _emd_distance(subs.dropna().values, x.values)
+                )
+                t_max = float(t_values.max()) if len(t_values) else 0.0
+                t_avg = float(t_values.mean()) if len(t_values) else 0.0
+                return TClosenessReport(t_max=t_max, t_avg=t_avg, bins=bins.tolist(), method=t_method)
+            # Vectorised TVD: digitise every row once, then build the whole
+            # per-group histogram matrix with one scatter-add instead of a
+            # Python dist_func call per equivalence class.
+            vals = s.to_numpy(dtype=float)
+            valid = ~np.isnan(vals)
+            nbins = len(bins) - 1
+            bin_idx = np.searchsorted(bins, vals[valid], side="right") - 1
+            np.clip(bin_idx, 0, nbins - 1, out=bin_idx)  # right edge is inclusive
         else:
-            cats = s.dropna().unique()
-            global_probs = s.value_counts(normalize=True).reindex(cats, fill_value=0).values
-            def dist_func(subs: pd.Series) -> float:
-                p = subs.value_counts(normalize=True).reindex(cats, fill_value=0).values
-                return _total_variation_distance(p, global_probs)
-
-        t_values = self.df.groupby(qi_cols, dropna=False)[sensitive_col].apply(dist_func)
+            # Factorise in order of appearance, matching s.dropna().unique()
+            codes, cats = pd.factorize(s)
+            valid = codes >= 0  # drop NaN (sentinel -1)
+            nbins = len(cats)
+            bin_idx = codes[valid]
+
+        gcodes = grouped.ngroup().to_numpy()
+        ngroups = int(gcodes.max()) + 1 if len(gcodes) else 0
+        counts = np.zeros((ngroups, nbins))
+        np.add.at(counts, (gcodes[valid], bin_idx), 1.0)
+        # The global distribution is just the column sum of the per-group
+        # matrix; no second pass over the raw values is needed.
+        global_counts = counts.sum(axis=0)
+        global_probs = global_counts / global_counts.sum() if global_counts.sum() > 0 else global_counts
+        if _groupwise_tvd_kernel is not None:
+            t_values = _groupwise_tvd_kernel(counts, np.asarray(global_probs, dtype=float))
+        else:
+            row_sums = counts.sum(axis=1, keepdims=True)
+            probs = np.divide(counts, row_sums, out=np.zeros_like(counts), where=row_sums > 0)
+            t_values = 0.5 * np.abs(probs - global_probs).sum(axis=1)
         t_max = float(t_values.max()) if len(t_values) else 0.0
         t_avg = float(t_values.mean()) if len(t_values) else 0.0
         return TClosenessReport(t_max=t_max, t_avg=t_avg, bins=(bins.tolist() if bins is not None else None), method=t_method)
@@ -280,6 +441,25 @@ class AnonymisationValidator:
         - Behaviour patterns (rare QI combinations, sensitive skew, QI-sensitive correlation)
         - (Optional) linkage attack simulation
         """
+        # full_report is deterministic in the data and parameters: memoise on
+        # a fingerprint of the columns actually used plus the parameter tuple,
+        # so repeated runs (dashboard refreshes, CLI re-invocations on an
+        # unchanged frame) collapse to a dict lookup.
+        try:
+            fp = hash(pd.util.hash_pandas_object(self.df[qi_cols + [sensitive_col]], index=False).values.tobytes())
+            ext_fp = (hash(pd.util.hash_pandas_object(external_df, index=False).values.tobytes())
+                      if external_df is not None else None)
+            cache_key = (
+                fp, ext_fp, self.df.shape, tuple(qi_cols), sensitive_col,
+                k_required, l_required, l_method, t_required, reid_required,
+                numeric_bins, dominance_threshold, rare_threshold,
+                binning_method, t_method,
+            )
+        except TypeError:
+            cache_key = None
+        if cache_key is not None and cache_key in self._report_cache:
+            return copy.deepcopy(self._report_cache[cache_key])
+
         report: Dict[str, Any] = {}
 
         # Add suggested thresholds
@@ -302,27 +482,45 @@ class AnonymisationValidator:
         }
         report["suggested_thresholds"] = suggested
 
+        # One C-level reduction over the whole frame instead of a Python-level
+        # scan per column.
+        missing = self.df.isna().mean()
         report["data_summary"] = {
             "n_rows": int(len(self.df)),
             "n_cols": int(self.df.shape[1]),
-            "missing_rates": {col: float(self.df[col].isna().mean()) for col in self.df.columns},
+            "missing_rates": {col: float(rate) for col, rate in missing.items()},
         }
 
-        import datetime
-        debug_lines = []
-        debug_lines.append(f"[DEBUG {datetime.datetime.now()}] Validator input QI columns: {qi_cols}")
-        debug_lines.append(f"[DEBUG {datetime.datetime.now()}] Validator input sensitive column: {sensitive_col}")
+        # Debug output goes through logging with lazy %-formatting: nothing is
+        # formatted (and no log file is touched) unless DEBUG is enabled,
+        # keeping the hot path free of timestamp formatting and sync writes.
+        logger.debug("Validator input QI columns: %s", qi_cols)
+        logger.debug("Validator input sensitive column: %s", sensitive_col)
+        # Build the QI grouping once; hashing the QI columns dominates on
+        # large frames, and every metric plus the behaviour-pattern scan
+        # groups on exactly the same keys. observed=True keeps categorical
+        # QIs from materialising the Cartesian product of unobserved
+        # category combinations; warn if that product would have blown up.
+        cat_sizes = [len(self.df[c].dtype.categories) for c in qi_cols
+                     if isinstance(self.df[c].dtype, pd.CategoricalDtype)]
+        if cat_sizes and math.prod(cat_sizes) > 10 * len(self.df):
+            logger.warning(
+                "Categorical QI columns span %d potential combinations for %d rows; "
+                "grouping with observed=True to avoid unobserved-group blowup.",
+                math.prod(cat_sizes), len(self.df),
+            )
+        grouped = self.df.groupby(qi_cols, dropna=False, observed=True, sort=False)
         # k-anonymity
         try:
-            krep = self.k_anonymity(qi_cols)
+            krep = self.k_anonymity(qi_cols, grouped=grouped)
             k_dict = krep.__dict__
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] k-anonymity result: {k_dict}")
+            logger.debug("k-anonymity result: %s", k_dict)
         except Exception as e:
             k_dict = {"k_min": None, "k_avg": None}
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] k-anonymity error: {e}")
+            logger.debug("k-anonymity error: %s", e)
         # l-diversity
         try:
-            lrep = self.l_diversity(qi_cols, sensitive_col, method=l_method)
+            lrep = self.l_diversity(qi_cols, sensitive_col, method=l_method, grouped=grouped)
             ldict = {
                 "method": lrep.method,
                 "l_min": lrep.l_min,
@@ -335,28 +533,18 @@ class AnonymisationValidator:
                     "entropy_effective_min": lrep.entropy_effective_min,
                     "entropy_effective_avg": lrep.entropy_effective_avg,
                 })
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] l-diversity result: {ldict}")
+            logger.debug("l-diversity result: %s", ldict)
         except Exception as e:
             ldict = {"method": None, "l_min": None, "l_avg": None}
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] l-diversity error: {e}")
+            logger.debug("l-diversity error: %s", e)
         # t-closeness
         try:
-            trep = self.t_closeness(qi_cols, sensitive_col, numeric_bins=numeric_bins, binning_method=binning_method, t_method=t_method)
+            trep = self.t_closeness(qi_cols, sensitive_col, numeric_bins=numeric_bins, binning_method=binning_method, t_method=t_method, grouped=grouped)
             t_dict = trep.__dict__
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] t-closeness result: {t_dict}")
+            logger.debug("t-closeness result: %s", t_dict)
         except Exception as e:
             t_dict = {"t_max": None, "t_avg": None, "method": None}
-            debug_lines.append(f"[DEBUG {datetime.datetime.now()}] t-closeness error: {e}")
-        # Write debug lines to log.txt
-        try:
-            with open('log.txt', 'a') as logf:
-                for line in debug_lines:
-                    logf.write(line + "\n")
-        except Exception:
-            pass
-        report["k_anonymity"] = k_dict
-        report["l_diversity"] = ldict
-        report["t_closeness"] = t_dict
+            logger.debug("t-closeness error: %s", e)
         report["k_anonymity"] = k_dict
         report["l_diversity"] = ldict
         report["t_closeness"] = t_dict
@@ -375,22 +563,22 @@ class AnonymisationValidator:
             if l_method == "entropy":
                 if lrep.entropy_effective_min < l_required:
                     flags.append(f"entropy l-diversity (effective) below threshold: {lrep.entropy_effective_min:.3f} < {l_required}")
-                    repairs.append(f"Consider generalising QIs or grouping sensitive values to increase entropy.")
+                    repairs.append(_REPAIR_L_ENTROPY)
             else:
                 if lrep.l_min < l_required:
                     flags.append(f"l-diversity (distinct) below threshold: {lrep.l_min} < {l_required}")
-                    repairs.append(f"Consider generalising QIs to increase diversity.")
+                    repairs.append(_REPAIR_L_DISTINCT)
 
         if t_required is not None and trep.t_max > t_required:
             flags.append(f"t-closeness above threshold: {trep.t_max:.4f} > {t_required}")
-            repairs.append(f"Consider generalising QIs or binning sensitive variable differently.")
+            repairs.append(_REPAIR_T)
 
         if external_df is not None:
             attack_results = simulate_linkage_attack(self.df, external_df, qi_cols)
             report["attack_simulation"] = attack_results
             if reid_required is not None and attack_results["reid_probability"] > reid_required:
                 flags.append(f"Re-identification probability too high: {attack_results['reid_probability']:.2f} > {reid_required}")
-                repairs.append("Consider suppressing unique QI combinations or generalising QIs.")
+                repairs.append(_REPAIR_REID)
 
         report["risk_flags"] = flags
         report["repair_suggestions"] = repairs
@@ -404,42 +592,96 @@ class AnonymisationValidator:
             "qi_sensitive_correlation": []
         }
 
-        grouped = self.df.groupby(qi_cols, dropna=False)
-        for qi_vals, group in grouped:
-            if len(group) <= rare_threshold:
-                behaviour_patterns["rare_combinations"].append({
-                    "qi_values": dict(zip(qi_cols, qi_vals if isinstance(qi_vals, tuple) else [qi_vals])),
-                    "count": int(len(group))
-                })
-            dist = group[sensitive_col].value_counts(normalize=True, dropna=False)
-            if not dist.empty and dist.max() > dominance_threshold:
+        # Group sizes and per-group sensitive distributions computed in bulk:
+        # iterating materialised sub-frames and calling value_counts per group
+        # is strided access plus a Python round trip per equivalence class.
+        sizes = grouped.size()
+        keys = sizes.index
+        sizes_arr = sizes.to_numpy()
+
+        # Keys stay in the index until a group is actually flagged; dicts are
+        # only materialised for the (typically tiny) set of hits.
+        def _qi_dict(key):
+            return dict(zip(qi_cols, key if isinstance(key, tuple) else (key,)))
+
+        for i in np.flatnonzero(sizes_arr <= rare_threshold):
+            behaviour_patterns["rare_combinations"].append({
+                "qi_values": _qi_dict(keys[i]),
+                "count": int(sizes_arr[i])
+            })
+
+        gcodes = grouped.ngroup().to_numpy()
+        scodes, scats = pd.factorize(self.df[sensitive_col], use_na_sentinel=False)
+        ngroups = len(sizes_arr)
+        if ngroups and len(scats):
+            counts = np.bincount(gcodes * len(scats) + scodes, minlength=ngroups * len(scats))
+            counts = counts.reshape(ngroups, len(scats)).astype(float)
+            freqs = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1.0)
+            freq_max = freqs.max(axis=1)
+            dominant = freqs.argmax(axis=1)
+            for i in np.flatnonzero(freq_max > dominance_threshold):
                 behaviour_patterns["sensitive_skew"].append({
-                    "qi_values": dict(zip(qi_cols, qi_vals if isinstance(qi_vals, tuple) else [qi_vals])),
-                    "dominant_sensitive": str(dist.idxmax()),
-                    "frequency": float(dist.max())
+                    "qi_values": _qi_dict(keys[i]),
+                    "dominant_sensitive": str(scats[dominant[i]]),
+                    "frequency": float(freq_max[i])
                 })
 
         try:
             s = self.df[sensitive_col]
-            if pd.api.types.is_numeric_dtype(s):
+            # Constant columns carry no association (corr is undefined,
+            # Cramér's V is 0); a single nunique pass lets both branches
+            # skip them before any expensive work or scipy warnings.
+            nunique_per_qi = self.df[qi_cols].nunique(dropna=False)
+            # One dtype sweep instead of an is_numeric_dtype dispatch per QI
+            # per loop iteration.
+            numeric_cols = set(self.df.select_dtypes(include=np.number).columns)
+            if s.nunique(dropna=False) < 2:
+                pass
+            elif sensitive_col in numeric_cols:
+                s_vals = s.to_numpy(dtype=float)
+                s_nan = np.isnan(s_vals)
                 for qi in qi_cols:
-                    if pd.api.types.is_numeric_dtype(self.df[qi]):
-                        corr = float(self.df[[qi, sensitive_col]].corr().iloc[0, 1])
-                        if abs(corr) > 0.5:
-                            behaviour_patterns["qi_sensitive_correlation"].append({
-                                "qi": qi,
-                                "sensitive": sensitive_col,
-                                "correlation": corr
-                            })
+                    if nunique_per_qi[qi] < 2 or qi not in numeric_cols:
+                        continue
+                    q_vals = self.df[qi].to_numpy(dtype=float)
+                    pair = ~(np.isnan(q_vals) | s_nan)  # pairwise-complete, as .corr() did
+                    if pair.sum() < 2:
+                        continue
+                    corr = float(np.corrcoef(q_vals[pair], s_vals[pair])[0, 1])
+                    if abs(corr) > 0.5:
+                        behaviour_patterns["qi_sensitive_correlation"].append({
+                            "qi": qi,
+                            "sensitive": sensitive_col,
+                            "correlation": corr
+                        })
             else:
                 n = len(self.df)
+                # Factorise the sensitive column once; each QI then needs one
+                # factorize + bincount to build its contingency table, instead
+                # of a crosstab (groupby + pivot) re-reading s per QI.
+                s_codes, s_cats = pd.factorize(s)
+                ns = len(s_cats)
                 for qi in qi_cols:
-                    table = pd.crosstab(self.df[qi], s)
-                    if table.size == 0 or n == 0:
+                    if nunique_per_qi[qi] < 2:
                         continue
-                    chi2, p, dof, expected = chi2_contingency(table, correction=False)
+                    q_codes, q_cats = pd.factorize(self.df[qi])
+                    mask = (q_codes >= 0) & (s_codes >= 0)  # crosstab drops NaN
+                    if ns == 0 or len(q_cats) == 0 or n == 0 or not mask.any():
+                        continue
+                    table = np.bincount(q_codes[mask] * ns + s_codes[mask], minlength=len(q_cats) * ns)
+                    table = table.reshape(len(q_cats), ns).astype(float)
+                    # Drop empty rows/columns (categories only seen in NaN pairs)
+                    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
                     r, c = table.shape
-                    denom = n * (min(r - 1, c - 1) if min(r - 1, c - 1) > 0 else 1)
+                    if min(r - 1, c - 1) <= 0:
+                        # 1xN / Nx1 tables have chi2 = 0 and Cramér's V = 0
+                        continue
+                    n_obs = table.sum()
+                    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n_obs
+                    chi2 = float(((table - expected) ** 2 / expected).sum())
+                    dof = (r - 1) * (c - 1)
+                    p = float(chi2_dist.sf(chi2, dof))
+                    denom = n * min(r - 1, c - 1)
                     cramers_v = math.sqrt(chi2 / denom) if denom > 0 else 0.0
                     if cramers_v > 0.2:
                         behaviour_patterns["qi_sensitive_correlation"].append({
@@ -453,4 +695,6 @@ class AnonymisationValidator:
             behaviour_patterns["correlation_error"] = str(e)
 
         report["behaviour_patterns"] = behaviour_patterns
+        if cache_key is not None:
+            self._report_cache[cache_key] = copy.deepcopy(report)
         return report
\ No newline at end of file
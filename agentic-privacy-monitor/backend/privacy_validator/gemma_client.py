@@ -4,22 +4,66 @@ Provides functions to classify columns, generate privacy summaries, and interact
 Used as an MCP tool for summarisation and column role inference.
 """
 
+import functools
+import hashlib
 import os
 import sys
 import json
-import re
+from collections import OrderedDict
 from google import genai
 from google.genai import types
 
+
+def _extract_json_object(text: str) -> str:
+    """
+    Return the first balanced top-level {...} object in text, or None.
+    Single forward scan with a brace-depth counter (string literals and
+    escapes respected), replacing the backtracking-prone greedy regex that
+    previously matched from the first '{' to the last '}'.
+    """
+    start = text.find('{')
+    if start == -1:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> genai.Client:
+    """
+    Lazy per-process genai client. Building the client sets up the HTTP
+    session and auth, so all calls share one instance (lru_cache makes the
+    initialisation thread-safe) instead of paying that cost per prompt.
+    """
+    return genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+
+
 def gemma_generate_content(prompt: str) -> str:
     """
     Call the Gemma LLM API with a prompt and return the generated text.
     Returns None on error.
     """
     try:
-        client = genai.Client(
-            api_key=os.environ.get("GEMINI_API_KEY"),
-        )
+        client = _client()
         model = "gemma-3n-e4b-it"
         contents = [
             types.Content(
@@ -41,10 +85,47 @@ def gemma_generate_content(prompt: str) -> str:
         return None
 
 
+# Column-role prompt template, pre-built at import so each call only pays for
+# one substitution of the header list.
+_COLUMN_ROLES_PROMPT = (
+    "Given the following dataset columns: {headers}\n"
+    "Which columns are likely quasi-identifiers (QIs) and which are sensitive attributes? "
+    "Respond ONLY with a valid JSON object with keys 'quasi_identifiers' and 'sensitive'. "
+    "Both values must be non-empty lists of valid column names from the input. "
+    "If you are unsure, make your best guess, but never leave either list empty. "
+    "Example: {{\"quasi_identifiers\": [\"col1\"], \"sensitive\": [\"col2\"]}}"
+)
+
+# Persistent cache of LLM column-role classifications keyed by the exact
+# header list, so re-scans of unchanged datasets skip the LLM round-trip.
+_COLUMN_ROLES_CACHE_PATH = os.path.join(os.path.dirname(__file__), ".column_roles_cache.json")
+_column_roles_cache = None
+
+def _get_column_roles_cache() -> dict:
+    global _column_roles_cache
+    if _column_roles_cache is None:
+        try:
+            with open(_COLUMN_ROLES_CACHE_PATH) as f:
+                _column_roles_cache = json.load(f)
+        except Exception:
+            _column_roles_cache = {}
+    return _column_roles_cache
+
+def _store_column_roles(cache_key: str, roles: dict):
+    cache = _get_column_roles_cache()
+    cache[cache_key] = roles
+    try:
+        with open(_COLUMN_ROLES_CACHE_PATH, 'w') as f:
+            json.dump(cache, f)
+    except Exception:
+        pass  # Cache persistence is best-effort
+
+
 def ask_llm_for_column_roles(headers: list[str], log_file_path: str = None) -> dict:
     """
     Use Gemma LLM to classify dataset headers into quasi-identifiers (QI) and sensitive attributes.
     Returns a dict with keys 'quasi_identifiers' and 'sensitive'.
+    Successful classifications are cached on disk keyed by the header list.
     """
 
     def log_debug(msg):
@@ -57,14 +138,15 @@ def ask_llm_for_column_roles(headers: list[str], log_file_path: str = None) -> d
         # If no log_file_path, do nothing (no print to terminal)
 
     log_debug(f"[ask_llm_for_column_roles] headers: {headers}")
-    prompt = (
-        f"Given the following dataset columns: {headers}\n"
-        "Which columns are likely quasi-identifiers (QIs) and which are sensitive attributes? "
-        "Respond ONLY with a valid JSON object with keys 'quasi_identifiers' and 'sensitive'. "
-        "Both values must be non-empty lists of valid column names from the input. "
-        "If you are unsure, make your best guess, but never leave either list empty. "
-        "Example: {\"quasi_identifiers\": [\"col1\"], \"sensitive\": [\"col2\"]}"
-    )
+    cache_key = json.dumps(list(headers))
+    cached = _get_column_roles_cache().get(cache_key)
+    if cached:
+        log_debug(f"[ask_llm_for_column_roles] cache hit: {cached}")
+        return {
+            "quasi_identifiers": list(cached.get("quasi_identifiers", [])),
+            "sensitive": list(cached.get("sensitive", [])),
+        }
+    prompt = _COLUMN_ROLES_PROMPT.format(headers=headers)
     log_debug(f"[ask_llm_for_column_roles] prompt: {prompt}")
 
     response = gemma_generate_content(prompt)
@@ -74,9 +156,9 @@ def ask_llm_for_column_roles(headers: list[str], log_file_path: str = None) -> d
     if response:
         # Try to extract JSON from response text
         try:
-            match = re.search(r"\{.*\}", response, re.DOTALL)
-            if match:
-                parsed = json.loads(match.group(0))
+            obj_text = _extract_json_object(response)
+            if obj_text:
+                parsed = json.loads(obj_text)
                 qi = parsed.get("quasi_identifiers", [])
                 sensitive = parsed.get("sensitive", [])
                 # normalize to list if not already
@@ -87,25 +169,44 @@ def ask_llm_for_column_roles(headers: list[str], log_file_path: str = None) -> d
         except Exception as e:
             log_debug(f"Error parsing LLM response: {e}\nRaw response: {response}")
 
+    # Only cache real LLM classifications, never heuristic fallbacks
+    parsed_ok = bool(qi) and bool(sensitive)
+
     # Fallback: if LLM returns empty, use heuristics
     if (not qi or len(qi) == 0) and headers:
         qi = [headers[0]]
     if (not sensitive or len(sensitive) == 0) and headers:
         sensitive = [headers[-1]]
+    if parsed_ok:
+        _store_column_roles(cache_key, {"quasi_identifiers": qi, "sensitive": sensitive})
     return {"quasi_identifiers": qi, "sensitive": sensitive}
 
 
 # ---------------------------
 # New function for summariser
 # ---------------------------
+# In-process LRU of summary responses keyed by a digest of the prompt, so
+# re-scans that rebuild the exact same prompt skip the LLM round-trip.
+_SUMMARY_CACHE = OrderedDict()
+_SUMMARY_CACHE_MAX = 256
+
 def summarise_privacy_report(prompt_text: str) -> str:
     """
     Send a privacy summary prompt to Gemma and return a human-readable summary.
     Used by summariser agents as an MCP tool.
+    Identical prompts are served from an in-process LRU cache.
     """
+    key = hashlib.blake2b(prompt_text.encode(), digest_size=16).digest()
+    cached = _SUMMARY_CACHE.get(key)
+    if cached is not None:
+        _SUMMARY_CACHE.move_to_end(key)
+        return cached
     response = gemma_generate_content(prompt_text)
     if not response:
         raise RuntimeError("Gemma failed to generate summary")
+    _SUMMARY_CACHE[key] = response
+    while len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+        _SUMMARY_CACHE.popitem(last=False)
     return response
 
 
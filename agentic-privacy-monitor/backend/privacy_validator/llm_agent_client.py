@@ -4,22 +4,88 @@ Supports Gemini/Gemma models for column classification and privacy summary gener
 Used as an MCP tool for summarisation and column role inference.
 """
 
+import functools
+import hashlib
 import os
 import sys
 import json
 import re
+import threading
+import time
+from collections import OrderedDict
 from google import genai
 from google.genai import types
 
-def llm_generate_content(prompt: str, model: str) -> str:
+# Responses are cached by (model, prompt) digest: an in-process LRU absorbs
+# repeats within one run, and one file per digest under the module-local
+# cache dir survives restarts. Only successful responses are stored.
+_LLM_CACHE_DIR = os.path.join(os.path.dirname(__file__), ".llm_cache")
+_LLM_MEM_CACHE = OrderedDict()
+_LLM_MEM_CACHE_MAX = 256
+
+# Bounded JSON-object pattern (one nesting level is enough for the flat
+# column-roles object), compiled once; unlike the previous greedy
+# re.search(r"{.*}", ..., DOTALL) it cannot backtrack across the whole
+# response.
+_JSON_OBJ_RE = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}")
+
+def _llm_cache_key(prompt: str, model: str) -> str:
+    return hashlib.blake2b((model + "\0" + prompt).encode(), digest_size=16).hexdigest()
+
+
+# Spacing-based rate limiter so concurrent orchestration/batching stays
+# under the Gemini request-per-minute cap instead of triggering retry
+# storms. GEMINI_RPM=0 (the default) disables it. Calls are spaced
+# 60/RPM seconds apart; cache hits never touch the limiter.
+_GEMINI_RPM = float(os.environ.get("GEMINI_RPM", "0"))
+_RATE_LOCK = threading.Lock()
+_next_call_at = 0.0
+
+def _rate_limit():
+    global _next_call_at
+    if _GEMINI_RPM <= 0:
+        return
+    interval = 60.0 / _GEMINI_RPM
+    with _RATE_LOCK:
+        now = time.monotonic()
+        wait = _next_call_at - now
+        _next_call_at = max(now, _next_call_at) + interval
+    if wait > 0:
+        time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=1)
+def _client() -> genai.Client:
+    """
+    Lazy per-process genai client; generate_content is thread-safe, so all
+    calls share one connection-pooled instance instead of re-initialising
+    HTTP and auth state per call.
+    """
+    return genai.Client(api_key=os.environ.get("GEMINI_API_KEY"))
+
+def llm_generate_content(prompt: str, model: str, no_cache: bool = False) -> str:
     """
     Call the specified LLM API (Gemini/Gemma) with a prompt and return the generated text.
+    Identical (model, prompt) pairs are served from cache unless no_cache is set.
     Returns None on error.
     """
+    key = None
+    if not no_cache:
+        key = _llm_cache_key(prompt, model)
+        cached = _LLM_MEM_CACHE.get(key)
+        if cached is not None:
+            _LLM_MEM_CACHE.move_to_end(key)
+            return cached
+        try:
+            with open(os.path.join(_LLM_CACHE_DIR, key)) as f:
+                cached = f.read()
+            _LLM_MEM_CACHE[key] = cached
+            return cached
+        except Exception:
+            pass
     try:
-        client = genai.Client(
-            api_key=os.environ.get("GEMINI_API_KEY"),
-        )
+        _rate_limit()
+        client = _client()
         contents = [
             types.Content(
                 role="user",
@@ -34,7 +100,18 @@ def llm_generate_content(prompt: str, model: str) -> str:
             contents=contents,
             config=generate_content_config,
         )
-        return response.text
+        text = response.text
+        if text is not None and key is not None:
+            _LLM_MEM_CACHE[key] = text
+            while len(_LLM_MEM_CACHE) > _LLM_MEM_CACHE_MAX:
+                _LLM_MEM_CACHE.popitem(last=False)
+            try:
+                os.makedirs(_LLM_CACHE_DIR, exist_ok=True)
+                with open(os.path.join(_LLM_CACHE_DIR, key), "w") as f:
+                    f.write(text)
+            except Exception:
+                pass  # Cache persistence is best-effort
+        return text
     except Exception as e:
         print(f"LLM API error: {e}", file=sys.stderr)
         return None
@@ -65,16 +142,23 @@ def ask_llm_for_column_roles(headers: list[str], log_file_path: str = None) -> d
     )
     log_debug(f"[ask_llm_for_column_roles] prompt: {prompt}")
 
-    response = llm_generate_content(prompt)
+    response = llm_generate_content(prompt, "gemma-3n-e4b-it")
     log_debug(f"[ask_llm_for_column_roles] LLM response: {response}")
     qi = []
     sensitive = None
     if response:
         # Try to extract JSON from response text
         try:
-            match = re.search(r"\{.*\}", response, re.DOTALL)
-            if match:
-                parsed = json.loads(match.group(0))
+            # Fast path: structured responses are usually pure JSON already,
+            # at most wrapped in a Markdown code fence.
+            stripped = response.strip()
+            stripped = stripped.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+            try:
+                parsed = json.loads(stripped)
+            except ValueError:
+                match = _JSON_OBJ_RE.search(response)
+                parsed = json.loads(match.group(0)) if match else None
+            if isinstance(parsed, dict):
                 qi = parsed.get("quasi_identifiers", [])
                 sensitive = parsed.get("sensitive", None)
                 # normalize sensitive if it comes as array
@@ -8,22 +8,38 @@ import glob
 import os
 from typing import List
 
+_TABULAR_EXTENSIONS = ('.csv', '.xls', '.xlsx')
+
+# Directories that never contain datasets; pruned so the walk does not
+# descend into them.
+_SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', '.venv', 'dist'}
+
 def discover_tabular_datasets(search_globs=None, repo_root: str = None) -> List[str]:
     """
     Discover all tabular datasets (CSV, XLS, XLSX files) in the repository.
     Args:
-        search_globs: List of glob patterns for dataset files (default ['**/*.csv', '**/*.xls', '**/*.xlsx']).
+        search_globs: Optional list of glob patterns for dataset files; when
+            omitted, a single directory walk matches the default extensions.
         repo_root: Root directory to search from. If None, uses three levels up from this file.
     Returns:
         List of absolute file paths to discovered datasets.
     """
-    if search_globs is None:
-        search_globs = ['**/*.csv', '**/*.xls', '**/*.xlsx']
     if repo_root is None:
         repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
+    if search_globs is not None:
+        # Explicit patterns keep the original glob semantics
+        dataset_paths = []
+        for pattern in search_globs:
+            full_pattern = os.path.join(repo_root, pattern)
+            dataset_paths.extend(glob.glob(full_pattern, recursive=True))
+        dataset_paths = [p for p in dataset_paths if os.path.isfile(p)]
+        return sorted(set(dataset_paths))
+    # Default case: one walk over the tree, matching extensions inline,
+    # instead of one recursive glob pass (plus isfile re-checks) per pattern.
     dataset_paths = []
-    for pattern in search_globs:
-        full_pattern = os.path.join(repo_root, pattern)
-        dataset_paths.extend(glob.glob(full_pattern, recursive=True))
-    dataset_paths = [p for p in dataset_paths if os.path.isfile(p)]
-    return sorted(set(dataset_paths))
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.lower().endswith(_TABULAR_EXTENSIONS):
+                dataset_paths.append(os.path.join(dirpath, name))
+    return sorted(dataset_paths)
@@ -3,30 +3,75 @@ MCP tool interface for privacy monitoring agents.
 Provides standardized access to privacy validation, scanning, and summarization tools.
 """
 
+import os
+from functools import lru_cache
+
 from privacy_validator.llm_agent_client import ask_llm_for_column_roles, summarise_privacy_report
-from privacy_validator.gemma_client import ask_llm_for_column_roles as gemma_column_roles, summarise_privacy_report as gemma_summarise
 from privacy_validator.anonymisation_validator import AnonymisationValidator
 import pandas as pd
 
+try:
+    # Optional: PyArrow's multithreaded CSV reader is considerably faster
+    # than the default engine on large files.
+    import pyarrow  # noqa: F401
+    _READ_CSV_KWARGS = {"engine": "pyarrow"}
+except ImportError:
+    _READ_CSV_KWARGS = {}
+
+
+@lru_cache(maxsize=32)
+def _load_df(path, mtime):
+    """
+    Parse a CSV once per (path, mtime); repeat tool calls on an unchanged
+    file reuse the parsed frame instead of re-reading it. The mtime key
+    invalidates the entry when the file changes.
+    """
+    return pd.read_csv(path, **_READ_CSV_KWARGS)
+
+
+@lru_cache(maxsize=8)
+def _validator_for(path, mtime):
+    """
+    One validator per (path, mtime): repeated full_report calls on the
+    same file — e.g. a UI trying different QI/sensitive combinations —
+    reuse the instance instead of rebuilding it per call.
+    """
+    return AnonymisationValidator(_load_df(path, mtime))
+
+
 class MCPPrivacyTools:
     """
     Model Context Protocol (MCP) tool interface for privacy monitoring.
     """
     def validate_privacy(self, dataset_path, model="gemini-pro"):
-        df = pd.read_csv(dataset_path)
-        headers = list(df.columns)
+        # Only the header row is needed; skip parsing the data entirely
+        headers = list(pd.read_csv(dataset_path, nrows=0).columns)
         # Use Gemini/Gemma to classify columns
         result = ask_llm_for_column_roles(headers, model)
         return result
 
     def scan_privacy(self, dataset_path, model="gemini-pro"):
-        df = pd.read_csv(dataset_path)
+        # The prompt only shows df.head(), so five rows suffice
+        df = pd.read_csv(dataset_path, nrows=5)
         prompt = f"Scan the following dataset for privacy risks or sensitive information:\n{df.head().to_string()}"
         # Use Gemini/Gemma to scan
         summary = summarise_privacy_report(prompt, model)
         return summary
 
+    # Validation results carry many internal fields (equivalence-class
+    # histograms, raw params, debug data) that only inflate the prompt;
+    # keep the metrics the LLM is actually asked to reason about.
+    _SUMMARY_KEYS = ("k_anonymity", "l_diversity", "t_closeness", "risk_flags", "repair_suggestions")
+
     def summarise_privacy(self, validation_result, scan_result, model="gemini-pro"):
+        if isinstance(validation_result, dict):
+            validation_result = {
+                k: validation_result[k] for k in self._SUMMARY_KEYS if k in validation_result
+            }
+        if isinstance(scan_result, dict):
+            scan_result = {
+                k: scan_result[k] for k in self._SUMMARY_KEYS if k in scan_result
+            }
         prompt = (
             f"Summarise the following privacy validation and scan results for a human reader.\n"
             f"Validation Result: {validation_result}\nScan Result: {scan_result}"
@@ -35,7 +80,6 @@ class MCPPrivacyTools:
         return summary
 
     def full_report(self, dataset_path, qi_cols, sensitive_col, **kwargs):
-        df = pd.read_csv(dataset_path)
-        validator = AnonymisationValidator(df)
+        validator = _validator_for(dataset_path, os.path.getmtime(dataset_path))
         report = validator.full_report(qi_cols=qi_cols, sensitive_col=sensitive_col, **kwargs)
         return report
@@ -1,6 +1,14 @@
+import asyncio
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+import httpx
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib json module is used otherwise
+    orjson = None
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,7 +16,18 @@ from pydantic import BaseModel
 from typing import List, Dict, Optional
 
 from privacy_validator.adk_multi_agent_system import OrchestratorAgent, MultiDatasetSummariserAgent
-from privacy_validator.summariser_agent import SummariserAgent
+
+def _dumps(obj, indent: bool = False) -> str:
+    """Serialise with orjson when available; stdlib json otherwise."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+def _loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 app = FastAPI()
 
@@ -24,38 +43,59 @@ app.add_middleware(
 # Instantiate agents
 agent = OrchestratorAgent()
 multi_summariser_agent = MultiDatasetSummariserAgent()
-summariser_agent = SummariserAgent()
 
 class OrchestrateRequest(BaseModel):
     datasets: List[str]
 
+# Parsed historical scans memoised per folder, keyed by the mtimes of the
+# three files that make up a scan; finished folders never change, so after
+# warmup a request costs one scandir plus a stat per file.
+_HIST_CACHE: Dict[str, tuple] = {}
+
 @app.get("/privacymonitor/historical")
-def get_historical_scans():
+def get_historical_scans(offset: int = 0, limit: Optional[int] = None):
+    """
+    Return historical scans, newest first. Optional offset/limit select a
+    page so only that slice of folders is touched on disk; omitting them
+    keeps the original return-everything behaviour.
+    """
     results_dir = os.path.join(os.path.dirname(__file__), "../results")
-    scan_folders = sorted(
-        [d for d in os.listdir(results_dir) if os.path.isdir(os.path.join(results_dir, d))],
-        reverse=True
-    )
+    with os.scandir(results_dir) as it:
+        scan_folders = sorted((entry.name for entry in it if entry.is_dir()), reverse=True)
+    total = len(scan_folders)
+    if offset or limit is not None:
+        scan_folders = scan_folders[offset:offset + limit if limit is not None else None]
     scans = []
     for folder in scan_folders:
         folder_path = os.path.join(results_dir, folder)
-        scan_result_path = os.path.join(folder_path, "scan_results.json")
-        explanation_path = os.path.join(folder_path, "explanation_report.txt")
-        log_path = os.path.join(folder_path, "log.txt")
+        file_keys = [
+            ("results", os.path.join(folder_path, "scan_results.json")),
+            ("explanationReport", os.path.join(folder_path, "explanation_report.txt")),
+            ("log", os.path.join(folder_path, "log.txt")),
+        ]
+        mtimes = []
+        for _, path in file_keys:
+            try:
+                mtimes.append(os.path.getmtime(path))
+            except OSError:
+                mtimes.append(None)
+        fingerprint = tuple(mtimes)
+        cached = _HIST_CACHE.get(folder)
+        if cached is not None and cached[0] == fingerprint:
+            scans.append(cached[1])
+            continue
 
         scan = {"id": folder, "timestamp": folder}
-        
-        for key, path in [("results", scan_result_path), 
-                          ("explanationReport", explanation_path), 
-                          ("log", log_path)]:
-            if os.path.exists(path):
+        for (key, path), mtime in zip(file_keys, mtimes):
+            if mtime is not None:
                 try:
                     with open(path, "r") as f:
-                        scan[key] = json.load(f) if key == "results" else f.read()
+                        scan[key] = _loads(f.read()) if key == "results" else f.read()
                 except Exception:
                     scan[key] = None
+        _HIST_CACHE[folder] = (fingerprint, scan)
         scans.append(scan)
-    return JSONResponse(content={"scans": scans})
+    return JSONResponse(content={"scans": scans, "total": total})
 
 @app.get("/.well-known/agent.json")
 def agent_card():
@@ -66,119 +106,137 @@ def agent_card():
         "skills": ["orchestration", "agent_discovery", "a2a_messaging"]
     }
 
+# Bound how many datasets are processed at once; each one runs the blocking
+# agent workflow in a worker thread plus one summariser round-trip.
+_ORCHESTRATE_CONCURRENCY = int(os.getenv("ORCHESTRATE_MAX_CONCURRENCY", "4"))
+
+# One keep-alive connection pool to the summariser for the process lifetime,
+# instead of a fresh client (TCP+TLS setup) per /orchestrate request. The
+# connect timeout keeps a dead summariser from stalling a whole orchestration;
+# the generous read timeout allows for slow LLM generations.
+_SUMMARISER_CLIENT = httpx.AsyncClient(
+    timeout=httpx.Timeout(60.0, connect=3.0),
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+)
+
+# Explanation files are written off the event loop so a slow disk does not
+# delay the next dataset's LLM round-trip; orchestrate waits on the futures
+# before writing the combined results.
+_IO_POOL = ThreadPoolExecutor(max_workers=4)
+
+def _write_text(path: str, text: str):
+    try:
+        with open(path, "w") as f:
+            f.write(text)
+    except Exception as e:
+        print(f"[WARN] Failed to write {path}: {e}")
+
 @app.post("/orchestrate")
-def orchestrate(request: OrchestrateRequest):
-    results: List[Dict] = []
+async def orchestrate(request: OrchestrateRequest):
     timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S-%fZ")
     base_dir = os.path.join(os.path.dirname(__file__), "../results", timestamp)
     os.makedirs(base_dir, exist_ok=True)
 
+    # Datasets are independent until the combined summary, and the per-dataset
+    # cost is dominated by agent/LLM round-trips, so fan out and gather.
+    # Results keep request order via position-indexed slots.
+    n = len(request.datasets)
+    results: List[Optional[Dict]] = [None] * n
+    structured_explanations: List[Optional[Dict]] = [None] * n
+    semaphore = asyncio.Semaphore(_ORCHESTRATE_CONCURRENCY)
+    pending_writes = []
 
-    structured_explanations: List[Dict] = []
-
-    import requests
-    for dataset_path in request.datasets:
+    async def process(idx: int, dataset_path: str):
         dataset_name = os.path.basename(dataset_path)
 
-        # Run orchestrator agent
-        result = agent.run(dataset_path, dataset_path=dataset_path, log_dir=base_dir)
+        async with semaphore:
+            # Run the blocking orchestrator agent in a worker thread
+            result = await asyncio.to_thread(agent.run, dataset_path, dataset_path=dataset_path, log_dir=base_dir)
 
-        # Safely parse MCP findings
-        mcp_findings_raw = result.get("validation_result")
-        mcp_findings: Dict = {}
-        mcp_parse_error: Optional[str] = None
-        debug_msg = f"[DEBUG {datetime.now()}] Raw MCP findings for {dataset_name}: {mcp_findings_raw}\n"
+            # Safely parse MCP findings. One timestamp per dataset is enough
+            # for these debug lines; they are emitted together anyway.
+            ts = datetime.now()
+            mcp_findings_raw = result.get("validation_result")
+            mcp_findings: Dict = {}
+            mcp_parse_error: Optional[str] = None
+            debug_msg = f"[DEBUG {ts}] Raw MCP findings for {dataset_name}: {mcp_findings_raw}\n"
+
+            if isinstance(mcp_findings_raw, dict):
+                mcp_findings = mcp_findings_raw
+            elif isinstance(mcp_findings_raw, str):
+                try:
+                    mcp_findings = _loads(mcp_findings_raw)
+                except Exception as e:
+                    mcp_parse_error = f"Failed to parse MCP findings string: {str(e)}"
+                    debug_msg += f"[ERROR {ts}] {mcp_parse_error}\n"
+            else:
+                debug_msg += f"[WARN {ts}] MCP findings are None or unexpected type, defaulting to empty dict.\n"
+            if not isinstance(mcp_findings, dict) or mcp_findings is None:
+                debug_msg += f"[WARN {ts}] MCP findings was null or not a dict.\n"
+            debug_msg += f"[DEBUG {ts}] MCP findings (pre-summary): {_dumps(mcp_findings)}\n"
 
-        if isinstance(mcp_findings_raw, dict):
-            mcp_findings = mcp_findings_raw
-        elif isinstance(mcp_findings_raw, str):
+            # Use A2A: POST to /summarise endpoint for summary generation
+            summarise_url = "http://localhost:8003/summarise"
+            # Pass only the validator and scan results, not the full result dict
+            summary_payload = {
+                "datasets": [dataset_name],
+                "results": {
+                    "validation_result": result.get("validation", {}),
+                    "scan_result": result.get("scan", {})
+                },
+                "log_file_path": os.path.join(base_dir, "log.txt")
+            }
+            # Log the exact payload being sent to the summariser
+            debug_msg += f"[DEBUG {ts}] Payload to /summarise: {_dumps(summary_payload)[:1000]}\n"
             try:
-                mcp_findings = json.loads(mcp_findings_raw)
+                resp = await _SUMMARISER_CLIENT.post(summarise_url, json=summary_payload)
+                debug_msg += f"[DEBUG {ts}] Response from /summarise: status={resp.status_code}, body={resp.text[:1000]}\n"
+                if resp.status_code == 200:
+                    summary_text = resp.json().get("summary")
+                else:
+                    summary_text = f"[ERROR] Summariser service returned status {resp.status_code}: {resp.text}"
             except Exception as e:
-                mcp_parse_error = f"Failed to parse MCP findings string: {str(e)}"
-                debug_msg += f"[ERROR {datetime.now()}] {mcp_parse_error}\n"
-        else:
-            debug_msg += f"[WARN {datetime.now()}] MCP findings are None or unexpected type, defaulting to empty dict.\n"
-        if not isinstance(mcp_findings, dict) or mcp_findings is None:
-            debug_msg += f"[WARN {datetime.now()}] MCP findings was null or not a dict.\n"
-        debug_msg += f"[DEBUG {datetime.now()}] MCP findings (pre-summary): {json.dumps(mcp_findings, default=str)}\n"
-
-        # Append debug logs
-        with open(os.path.join(base_dir, "log.txt"), "a") as logf:
-            logf.write(debug_msg)
-
-        # Use A2A: POST to /summarise endpoint for summary generation
-        summarise_url = "http://localhost:8003/summarise"
-        # Pass only the validator and scan results, not the full result dict
-        summary_payload = {
-            "datasets": [dataset_name],
-            "results": {
-                "validation_result": result.get("validation", {}),
-                "scan_result": result.get("scan", {})
-            },
-            "log_file_path": os.path.join(base_dir, "log.txt")
-        }
-        # Log the exact payload being sent to the summariser
-        debug_msg += f"[DEBUG {datetime.now()}] Payload to /summarise: {json.dumps(summary_payload, default=str)[:1000]}\n"
-        try:
-            resp = requests.post(summarise_url, json=summary_payload)
-            debug_msg += f"[DEBUG {datetime.now()}] Response from /summarise: status={resp.status_code}, body={resp.text[:1000]}\n"
-            if resp.status_code == 200:
-                summary_text = resp.json().get("summary")
-            else:
-                summary_text = f"[ERROR] Summariser service returned status {resp.status_code}: {resp.text}"
-        except Exception as e:
-            summary_text = f"[ERROR] Failed to call summariser service: {e}"
-            debug_msg += f"[ERROR {datetime.now()}] Exception calling /summarise: {e}\n"
-        # Write updated debug log
-        with open(os.path.join(base_dir, "log.txt"), "a") as logf:
-            logf.write(debug_msg)
-
-        explanation_file = os.path.join(base_dir, f"explanation_report_{dataset_name}.txt")
-        try:
-            with open(explanation_file, "w") as ef:
-                ef.write(summary_text)
-            structured_explanations.append({
+                summary_text = f"[ERROR] Failed to call summariser service: {e}"
+                debug_msg += f"[ERROR {ts}] Exception calling /summarise: {e}\n"
+            # One append per dataset keeps concurrent tasks' log lines together
+            with open(os.path.join(base_dir, "log.txt"), "a") as logf:
+                logf.write(debug_msg)
+
+            explanation_file = os.path.join(base_dir, f"explanation_report_{dataset_name}.txt")
+            # Fire-and-forget: the write overlaps with the next dataset's
+            # LLM call; errors are logged inside _write_text.
+            pending_writes.append(_IO_POOL.submit(_write_text, explanation_file, summary_text))
+            structured_explanations[idx] = {
                 "dataset_name": dataset_name,
                 "explanation": summary_text
-            })
-        except Exception:
-            structured_explanations.append({
-                "dataset_name": dataset_name,
-                "explanation": None,
-                "note": "Failed to save/read explanation"
-            })
-
-        results.append({
-            "dataset": dataset_path,
-            "result": result,
-            "mcp_findings": mcp_findings,
-            "mcp_findings_raw": mcp_findings_raw,
-            "mcp_parse_error": mcp_parse_error
-        })
+            }
+
+            results[idx] = {
+                "dataset": dataset_path,
+                "result": result,
+                "mcp_findings": mcp_findings,
+                "mcp_findings_raw": mcp_findings_raw,
+                "mcp_parse_error": mcp_parse_error
+            }
+
+    await asyncio.gather(*(process(i, ds) for i, ds in enumerate(request.datasets)))
+
+    # Ensure the per-dataset explanation files are on disk before the
+    # combined results that reference them are written.
+    if pending_writes:
+        await asyncio.to_thread(wait, pending_writes)
 
     # Save combined results
     with open(os.path.join(base_dir, "scan_results.json"), "w") as f:
-        json.dump({"results": results}, f, indent=2)
+        f.write(_dumps({"results": results}, indent=True))
 
-    # Read all individual summary files from disk for multi-dataset summary
-    disk_explanations = []
-    for dataset_path in request.datasets:
-        dataset_name = os.path.basename(dataset_path)
-        explanation_file = os.path.join(base_dir, f"explanation_report_{dataset_name}.txt")
-        explanation_text = None
-        try:
-            with open(explanation_file, "r") as ef:
-                explanation_text = ef.read()
-        except Exception:
-            explanation_text = None
-        disk_explanations.append({
-            "dataset_name": dataset_name,
-            "explanation": explanation_text
-        })
-    # Generate combined summary using MultiDatasetSummariserAgent
-    summary_result = multi_summariser_agent.run(
-        disk_explanations,
+    # Generate combined summary using MultiDatasetSummariserAgent; the
+    # per-dataset explanations were produced in memory above, so there is no
+    # need to round-trip them through the files just written. The agent
+    # blocks on the LLM, so keep it off the event loop.
+    summary_result = await asyncio.to_thread(
+        multi_summariser_agent.run,
+        structured_explanations,
         dataset_names=[os.path.basename(path) for path in request.datasets],
         log_file_path=os.path.join(base_dir, "log.txt")
     )
@@ -200,19 +258,18 @@ def parse_validator_results(results: Dict) -> Dict:
     try:
         validation_result = results.get("validation_result", {})
         if isinstance(validation_result, str):
-            validation_result = json.loads(validation_result)
+            validation_result = _loads(validation_result)
         # Debug: print the structure and contents of validation_result
-        import datetime
         try:
             with open('log.txt', 'a') as logf:
-                logf.write(f"[DEBUG {datetime.datetime.now()}] validation_result: {json.dumps(validation_result, default=str)}\n")
+                logf.write(f"[DEBUG {datetime.now()}] validation_result: {_dumps(validation_result)}\n")
         except Exception:
             pass
         if isinstance(validation_result, dict):
             params = validation_result.get("params", {})
             try:
                 with open('log.txt', 'a') as logf:
-                    logf.write(f"[DEBUG {datetime.datetime.now()}] params: {json.dumps(params, default=str)}\n")
+                    logf.write(f"[DEBUG {datetime.now()}] params: {_dumps(params)}\n")
             except Exception:
                 pass
             qi_list = []
@@ -6,6 +6,61 @@ from typing import List, Dict
 from .llm_agent_client import summarise_privacy_report
 import json
 
+# The prompt scaffolding never changes between calls, so it is assembled
+# once here; only the metrics JSON is interpolated per call. The metrics
+# are serialised compactly — indentation adds prompt tokens without
+# helping the model.
+_TASK_BODY = (
+    "1. Privacy Assessment: Describe the overall privacy risk in clear, non-technical language. "
+    "State whether re-identification risk is Low / Medium / High, and why.\n"
+    "2. Key Metrics: Report k-anonymity, l-diversity, t-closeness, and re-identification risk. "
+    "Compare them to thresholds if provided, and highlight any missing or failing metrics.\n"
+    "3. Data Characteristics: List all quasi-identifier and sensitive columns, explaining why they could create privacy risk.\n"
+    "4. Risk Flags: Summarize any risk flags or anomalies.\n"
+    "5. Recommended Actions: Provide concrete mitigation steps (e.g., generalization, suppression, access controls), "
+    "and recommend further analysis for missing metrics.\n\n"
+)
+
+_PROMPT_PREFIX = (
+    "You are a privacy-risk analysis assistant.\n\n"
+    "Below is the raw output of a privacy scan of a dataset:\n"
+    "RAW_SCAN_OUTPUT_JSON:\n"
+)
+
+_PROMPT_SUFFIX = (
+    "\n\nTASK:\n"
+    + _TASK_BODY +
+    "FORMAT:\n"
+    "Return a Markdown report with headings: Privacy Assessment, Key Metrics, Data Characteristics, Risk Flags, Recommended Actions."
+)
+
+_BATCH_PROMPT_PREFIX = (
+    "You are a privacy-risk analysis assistant.\n\n"
+    "Below are the raw outputs of privacy scans for several datasets, "
+    "as a JSON array (entry i describes dataset i, in order):\n"
+    "RAW_SCAN_OUTPUTS_JSON:\n"
+)
+
+_BATCH_PROMPT_SUFFIX = (
+    "\n\nTASK (apply to EACH dataset independently):\n"
+    + _TASK_BODY +
+    "FORMAT:\n"
+    "Return ONLY a valid JSON array of strings, one per input dataset in input order. "
+    "Each string must be a Markdown report with headings: Privacy Assessment, Key Metrics, "
+    "Data Characteristics, Risk Flags, Recommended Actions."
+)
+
+def _compact_metrics(structured_metrics: List[Dict]) -> List[Dict]:
+    """
+    Drop fields that carry no information ("Not calculated", empty lists)
+    before the metrics are serialised into a prompt; the LLM is told about
+    missing metrics by their absence, and every field costs tokens.
+    """
+    return [
+        {k: v for k, v in metrics.items() if v not in ("Not calculated", [], None)}
+        for metrics in structured_metrics
+    ]
+
 class SummariserAgent:
     def extract_metrics(self, explanations: List[Dict]) -> List[Dict]:
         """
@@ -56,24 +111,44 @@ class SummariserAgent:
         """
         Build a detailed prompt for the LLM using the raw metrics JSON.
         """
-        prompt = (
-            "You are a privacy-risk analysis assistant.\n\n"
-            "Below is the raw output of a privacy scan of a dataset:\n"
-            "RAW_SCAN_OUTPUT_JSON:\n"
-            f"{json.dumps(structured_metrics, indent=2)}\n\n"
-            "TASK:\n"
-            "1. Privacy Assessment: Describe the overall privacy risk in clear, non-technical language. "
-            "State whether re-identification risk is Low / Medium / High, and why.\n"
-            "2. Key Metrics: Report k-anonymity, l-diversity, t-closeness, and re-identification risk. "
-            "Compare them to thresholds if provided, and highlight any missing or failing metrics.\n"
-            "3. Data Characteristics: List all quasi-identifier and sensitive columns, explaining why they could create privacy risk.\n"
-            "4. Risk Flags: Summarize any risk flags or anomalies.\n"
-            "5. Recommended Actions: Provide concrete mitigation steps (e.g., generalization, suppression, access controls), "
-            "and recommend further analysis for missing metrics.\n\n"
-            "FORMAT:\n"
-            "Return a Markdown report with headings: Privacy Assessment, Key Metrics, Data Characteristics, Risk Flags, Recommended Actions."
+        payload = json.dumps(_compact_metrics(structured_metrics), separators=(",", ":"))
+        return _PROMPT_PREFIX + payload + _PROMPT_SUFFIX
+
+    def build_batch_prompt(self, metrics_batch: List[List[Dict]]) -> str:
+        """
+        Build one prompt covering several datasets' metrics at once.
+        """
+        payload = json.dumps(
+            [_compact_metrics(metrics) for metrics in metrics_batch], separators=(",", ":")
         )
-        return prompt
+        return _BATCH_PROMPT_PREFIX + payload + _BATCH_PROMPT_SUFFIX
+
+    def summarise_batch(self, explanations_list: List[List[Dict]], batch_size: int = 10) -> List[str]:
+        """
+        Summarise several datasets' explanations with one LLM call per batch
+        instead of one call per dataset. Returns one summary per input, in
+        order. Falls back to per-dataset summarise() for any batch whose
+        batched response cannot be parsed.
+        """
+        summaries: List[str] = []
+        for start in range(0, len(explanations_list), batch_size):
+            batch = explanations_list[start:start + batch_size]
+            metrics_batch = [self.extract_metrics(explanations) for explanations in batch]
+            prompt = self.build_batch_prompt(metrics_batch)
+            parsed = None
+            try:
+                response = summarise_privacy_report(prompt, model="gemma-3n-e4b-it")
+                # Tolerate prose or code fences around the array
+                lo, hi = response.find('['), response.rfind(']')
+                if lo != -1 and hi > lo:
+                    parsed = json.loads(response[lo:hi + 1])
+            except Exception:
+                parsed = None
+            if isinstance(parsed, list) and len(parsed) == len(batch) and all(isinstance(s, str) for s in parsed):
+                summaries.extend(parsed)
+            else:
+                summaries.extend(self.summarise(explanations) for explanations in batch)
+        return summaries
 
     def summarise(self, explanations: List[Dict]) -> str:
         """
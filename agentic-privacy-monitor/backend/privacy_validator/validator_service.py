@@ -8,6 +8,8 @@ agent = ValidatorAgent()
 class ValidateRequest(BaseModel):
     dataset: str
     dataset_path: str = None
+    # 'path' | 'csv' | 'records'; None lets the agent sniff the content
+    dataset_format: str = None
 
 @app.get("/.well-known/agent.json")
 def agent_card():
@@ -21,7 +23,7 @@ def agent_card():
 @app.post("/validate")
 def validate(request: ValidateRequest):
     try:
-        result = agent.run(request.dataset, dataset_path=request.dataset_path)
+        result = agent.run(request.dataset, dataset_path=request.dataset_path, dataset_format=request.dataset_format)
         # Ensure the key exists and is a JSON string
         if not result or "validation_result" not in result:
             result = {"validation_result": {}}